@@ -0,0 +1,65 @@
+"""
+Alembic environment running migrations over the app's async driver.
+
+The target metadata is the models' metadata, so `alembic revision
+--autogenerate` diffs the database against app/models. Online schema
+changes use op.get_context().autocommit_block() for statements that cannot
+run in a transaction (CREATE INDEX CONCURRENTLY) and for batched backfills,
+see app/db/backfills.py.
+"""
+import asyncio
+import logging
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.backfills import PROGRESS_TABLE
+from app.db.base import ASYNC_DATABASE_URL, Base
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+logger = logging.getLogger("alembic.env")
+
+target_metadata = Base.metadata
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    # Bookkeeping owned by the backfill runner, not by the models
+    return not (type_ == "table" and name == PROGRESS_TABLE)
+
+def configure(**kwargs) -> None:
+    context.configure(
+        target_metadata=target_metadata,
+        include_object=include_object,
+        compare_type=True,
+        **kwargs
+    )
+
+def run_migrations_offline() -> None:
+    """Emit SQL to stdout (alembic upgrade head --sql) without connecting."""
+    configure(url=ASYNC_DATABASE_URL, literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+def do_run_migrations(connection: Connection) -> None:
+    # SQLite can't ALTER most things in place; batch mode recreates the table
+    configure(connection=connection, render_as_batch=connection.dialect.name == "sqlite")
+    with context.begin_transaction():
+        context.run_migrations()
+
+async def run_migrations_online() -> None:
+    engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=pool.NullPool)
+    try:
+        async with engine.connect() as connection:
+            await connection.run_sync(do_run_migrations)
+    finally:
+        await engine.dispose()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
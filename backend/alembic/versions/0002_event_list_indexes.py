@@ -0,0 +1,59 @@
+"""indexes for event pagination and search
+
+(date, id) for keyset pagination and date-range filters, and trigram
+indexes (pg_trgm) for substring search, all built CONCURRENTLY on
+Postgres. events.updated_at gets the CURRENT_TIMESTAMP default the
+pagination validators rely on, a catalog-only change.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 04:54:10
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.backfills import create_index_online
+
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The trigram indexes need pg_trgm
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.alter_column(
+            'updated_at',
+            existing_type=sa.DateTime(timezone=True),
+            server_default=sa.text('(CURRENT_TIMESTAMP)'),
+            existing_nullable=False
+        )
+
+    create_index_online('ix_events_date_id', 'events', ['date', 'id'])
+    create_index_online(
+        'ix_events_title_trgm', 'events', ['title'],
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}
+    )
+    create_index_online(
+        'ix_events_description_trgm', 'events', ['description'],
+        postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_description_trgm', postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+        batch_op.drop_index('ix_events_title_trgm', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+        batch_op.drop_index('ix_events_date_id')
+        batch_op.alter_column(
+            'updated_at',
+            existing_type=sa.DateTime(timezone=True),
+            server_default=None,
+            existing_nullable=False
+        )
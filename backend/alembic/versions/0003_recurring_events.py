@@ -0,0 +1,60 @@
+"""recurring events
+
+events.recurrence_rule and recurrence_until, nullable with no default (a
+catalog-only change), the index finding series that overlap a window,
+built CONCURRENTLY on Postgres, and the new event_occurrence_overrides
+table.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 04:54:20
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.backfills import create_index_online
+
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('recurrence_rule', sa.String(), nullable=True))
+    op.add_column('events', sa.Column('recurrence_until', sa.DateTime(timezone=True), nullable=True))
+    create_index_online('ix_events_recurring_window', 'events', ['date', 'recurrence_until'])
+
+    op.create_table('event_occurrence_overrides',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('occurrence_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('cancelled', sa.Boolean(), nullable=False),
+    sa.Column('title', sa.String(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('time', sa.String(), nullable=True),
+    sa.Column('image_url', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id', 'occurrence_start', name='uq_event_occurrence_overrides_start')
+    )
+    with op.batch_alter_table('event_occurrence_overrides', schema=None) as batch_op:
+        batch_op.create_index('ix_event_occurrence_overrides_event_date', ['event_id', 'date'], unique=False)
+        batch_op.create_index(batch_op.f('ix_event_occurrence_overrides_id'), ['id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('event_occurrence_overrides', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_event_occurrence_overrides_id'))
+        batch_op.drop_index('ix_event_occurrence_overrides_event_date')
+
+    op.drop_table('event_occurrence_overrides')
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_recurring_window')
+        batch_op.drop_column('recurrence_until')
+        batch_op.drop_column('recurrence_rule')
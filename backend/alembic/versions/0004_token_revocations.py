@@ -0,0 +1,44 @@
+"""token revocations
+
+Revoked token ids and per-user revocation cutoffs, in a new table.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 04:54:30
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('token_revocations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('jti', sa.String(length=64), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('jti')
+    )
+    with op.batch_alter_table('token_revocations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_token_revocations_expires_at'), ['expires_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_token_revocations_id'), ['id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('token_revocations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_token_revocations_id'))
+        batch_op.drop_index(batch_op.f('ix_token_revocations_expires_at'))
+
+    op.drop_table('token_revocations')
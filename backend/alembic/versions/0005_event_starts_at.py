@@ -0,0 +1,113 @@
+"""events.starts_at, added online
+
+The column is nullable with no default, a catalog-only change. Its index is
+built CONCURRENTLY on Postgres and existing rows are filled by the batched
+backfill, so `events` stays writable throughout. Pass `-x backfill=skip`
+to leave the backfill for `python -m app.db.backfills events_starts_at`.
+
+The backfill's table and computation are frozen here as of this revision,
+rather than imported from the models, so later model changes can't alter
+what upgrading through 0005 does.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 05:10:00
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.backfills import Backfill, backfill_online, create_index_online
+
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+events = sa.table(
+    'events',
+    sa.column('id', sa.Integer()),
+    sa.column('date', sa.DateTime(timezone=True)),
+    sa.column('time', sa.String()),
+    sa.column('recurrence_rule', sa.String()),
+    sa.column('recurrence_until', sa.DateTime(timezone=True)),
+    sa.column('starts_at', sa.DateTime(timezone=True)),
+)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _rule_parts(rule: str) -> Dict[str, str]:
+    if rule.upper().startswith('RRULE:'):
+        rule = rule[6:]
+    parts = (part.partition('=') for part in rule.split(';') if part.strip())
+    return {name.strip().upper(): value.strip().upper() for name, _, value in parts}
+
+
+def _parse_until(value: str) -> datetime:
+    for fmt in ('%Y%m%dT%H%M%SZ', '%Y%m%dT%H%M%S', '%Y%m%d'):
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        if fmt == '%Y%m%d':
+            parsed = parsed.replace(hour=23, minute=59, second=59)
+        return parsed.replace(tzinfo=timezone.utc)
+    raise ValueError(f"Invalid UNTIL: {value!r}")
+
+
+def _series_end(rule: Optional[str], starts_at: datetime, until: Optional[datetime]) -> Optional[datetime]:
+    """
+    recurrence_until for the new start. An UNTIL series ends at UNTIL. A
+    COUNT series ends on the same UTC day as before, since the days don't
+    depend on the time of day, so only the time moves to the new start's.
+    """
+    if not rule:
+        return None
+    parts = _rule_parts(rule)
+    if 'UNTIL' in parts:
+        return max(_parse_until(parts['UNTIL']), starts_at)
+    if 'COUNT' in parts and until is not None:
+        return _as_utc(until).replace(hour=starts_at.hour, minute=starts_at.minute, second=0, microsecond=0)
+    return None
+
+
+class EventStartsAt(Backfill):
+    """Derive events.starts_at (and the zero-padded time) from date and time."""
+
+    name = 'events_starts_at'
+    table = events
+    columns = ('date', 'time', 'recurrence_rule', 'recurrence_until')
+
+    def pending(self):
+        return self.table.c.starts_at.is_(None)
+
+    def compute(self, row) -> Dict[str, Any]:
+        hours, minutes = map(int, row.time.split(':'))
+        starts_at = _as_utc(row.date).replace(hour=hours, minute=minutes, second=0, microsecond=0)
+        return {
+            'starts_at': starts_at,
+            'time': starts_at.strftime('%H:%M'),
+            'recurrence_until': _series_end(row.recurrence_rule, starts_at, row.recurrence_until),
+        }
+
+
+backfill = EventStartsAt()
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('starts_at', sa.DateTime(timezone=True), nullable=True))
+    create_index_online('ix_events_starts_at_id', 'events', ['starts_at', 'id'])
+    backfill_online(backfill)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_starts_at_id')
+        batch_op.drop_column('starts_at')
@@ -0,0 +1,53 @@
+"""timestamps set by the database on every table
+
+created_at/updated_at on users, token_revocations and
+event_occurrence_overrides become timezone-aware with a CURRENT_TIMESTAMP
+default, as events' already were, so inserts and updates get them back
+through RETURNING. The stored values were naive UTC and are converted as
+such. On Postgres the type change rewrites these tables, which are small.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 06:20:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('users', 'token_revocations', 'event_occurrence_overrides')
+COLUMNS = ('created_at', 'updated_at')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in COLUMNS:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    type_=sa.DateTime(timezone=True),
+                    server_default=sa.text('(CURRENT_TIMESTAMP)'),
+                    existing_nullable=False,
+                    postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+                )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in COLUMNS:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(timezone=True),
+                    type_=sa.DateTime(),
+                    server_default=None,
+                    existing_nullable=False,
+                    postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+                )
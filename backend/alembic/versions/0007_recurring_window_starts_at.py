@@ -0,0 +1,29 @@
+"""recurring window index on starts_at
+
+The occurrence window query filters series on starts_at, so the index
+finding them moves from (date, recurrence_until) to (starts_at,
+recurrence_until). The new index is built CONCURRENTLY on Postgres before
+the old one is dropped, also concurrently.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 07:40:00
+"""
+from typing import Sequence, Union
+
+from app.db.backfills import create_index_online, drop_index_online
+
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_online('ix_events_recurring_starts_at', 'events', ['starts_at', 'recurrence_until'])
+    drop_index_online('ix_events_recurring_window', 'events')
+
+
+def downgrade() -> None:
+    create_index_online('ix_events_recurring_window', 'events', ['date', 'recurrence_until'])
+    drop_index_online('ix_events_recurring_starts_at', 'events')
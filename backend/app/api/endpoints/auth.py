@@ -1,27 +1,34 @@
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
 from ...core.config import settings
 from ...core.security import (
-    get_password_hash,
+    get_password_hash_async,
     create_access_token,
-    verify_password,
+    verify_password_async,
     get_current_user,
+    get_current_admin_user,
+    get_token_claims,
     security
 )
+from ...core.revocation import revocation_list
+from ...core.serialization import fast_json_response
 from ...db.base import get_db
+from ...db.repository import users
 from ...models.user import User, UserRole
 from ...schemas.user import UserCreate, User as UserSchema, UserInDB
-from ...schemas.token import Token as TokenSchema
+from ...schemas.token import Token as TokenSchema, TokenRevoke
 
 router = APIRouter()
 
+# Fields exposed by the public User schema
+USER_FIELDS = tuple(UserSchema.model_fields)
+
 @router.post("/signup", response_model=UserSchema, status_code=status.HTTP_201_CREATED)
 async def signup(
     user_in: UserCreate,
@@ -29,28 +36,27 @@ async def signup(
 ):
     """Create a new user."""
     # Check if user already exists
-    result = await db.execute(select(User).filter(User.email == user_in.email))
-    db_user = result.scalars().first()
-    
-    if db_user:
+    if await users.get_by(db, User.id, email=user_in.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    # Create new user
-    hashed_password = get_password_hash(user_in.password)
-    db_user = User(
-        email=user_in.email,
-        name=user_in.name,
-        hashed_password=hashed_password,
-        role=user_in.role
-    )
-    
-    db.add(db_user)
+    # Create new user; RETURNING hands back the id and server defaults
+    hashed_password = await get_password_hash_async(user_in.password)
+    db_user = await users.create(db, {
+        "email": user_in.email,
+        "name": user_in.name,
+        "hashed_password": hashed_password,
+        "role": user_in.role
+    })
     await db.commit()
-    await db.refresh(db_user)
     
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json_response(
+            {name: getattr(db_user, name) for name in USER_FIELDS},
+            status_code=status.HTTP_201_CREATED
+        )
     return db_user
 
 @router.post("/login", response_model=TokenSchema)
@@ -60,11 +66,10 @@ async def login(
 ):
     """OAuth2 compatible token login, get an access token for future requests."""
     # Get user from database
-    result = await db.execute(select(User).filter(User.email == form_data.username))
-    user = result.scalars().first()
+    user = await users.get_by(db, email=form_data.username)
     
     # Verify user exists and password is correct
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -82,9 +87,13 @@ async def login(
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         subject=user.id,
-        expires_delta=access_token_expires
+        expires_delta=access_token_expires,
+        role=user.role,
+        is_active=user.is_active
     )
     
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json_response({"access_token": access_token, "token_type": "bearer"})
     return {
         "access_token": access_token,
         "token_type": "bearer",
@@ -96,4 +105,34 @@ async def read_users_me(
     current_user: UserInDB = Depends(get_current_user)
 ):
     """Get current user."""
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json_response(current_user.model_dump(include=set(USER_FIELDS)))
     return current_user
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    claims: Dict[str, Any] = Depends(get_token_claims),
+    db: AsyncSession = Depends(get_db)
+):
+    """Revoke the access token used for this request."""
+    expires_at = datetime.fromtimestamp(claims["exp"], tz=timezone.utc)
+    if "jti" in claims:
+        await revocation_list.record(db, jti=claims["jti"], expires_at=expires_at)
+    else:
+        # Tokens issued before `jti` existed can only be revoked together
+        await revocation_list.record(db, user_id=int(claims["sub"]), expires_at=expires_at)
+    return None
+
+@router.post("/revoke", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_tokens(
+    revoke_in: TokenRevoke,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_admin_user)
+):
+    """Revoke a token by `jti`, or every token issued so far to a user (admin only)."""
+    # Long enough to outlive any token the revocation could apply to
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    await revocation_list.record(
+        db, jti=revoke_in.jti, user_id=revoke_in.user_id, expires_at=expires_at
+    )
+    return None
@@ -1,41 +1,188 @@
-from typing import List, Optional, Union
-from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from datetime import datetime, timedelta
+import asyncio
+import csv
+import io
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.responses import StreamingResponse
 from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import and_, delete, or_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
-from ...db.base import get_db
+from ...db.base import get_db, async_session_maker
+from ...db.event_queries import apply_event_filters
+from ...db.bulk import parse_csv, parse_ndjson, import_events
+from ...db import repository
+from ...db.batch import REQUIRED_FIELDS, apply_event_batch
 from ...models.user import User, UserRole
-from ...models.event import Event
-from ...schemas.event import Event as EventSchema, EventCreate, EventUpdate, EventInDB
+from ...models.event import Event, EventOccurrenceOverride
+from ...schemas.event import (
+    Event as EventSchema,
+    EventCreate,
+    EventUpdate,
+    EventInDB,
+    EventOccurrence,
+    EventOccurrenceOverride as EventOccurrenceOverrideSchema,
+    EventBatch,
+    EventBatchResult,
+    BulkImportResult,
+    validate_time_format
+)
 from ...schemas.user import UserInDB
-from ...core.security import get_current_active_user, get_current_admin_user
+from ...core.user_cache import get_cached_user
+from ...core.security import (
+    TokenPrincipal,
+    get_current_active_principal,
+    get_current_admin_user
+)
+from ...core.change_feed import Change, change_feed
+from ...core.recurrence import as_utc, occurrence_cache, occurrences, RecurrenceRule
+from ...core.pagination import encode_cursor, decode_cursor, InvalidCursorError
+from ...core.http_cache import CachedResponse, events_response_cache, event_detail_cache
+from ...core.config import settings
+from ...core.serialization import dumps
 
 router = APIRouter()
 
+event_list_adapter = TypeAdapter(List[EventSchema])
+occurrence_list_adapter = TypeAdapter(List[EventOccurrence])
+
+# Event columns in response field order; `created_by` is built from the join
+EVENT_FIELDS = tuple(name for name in EventSchema.model_fields if name != "created_by")
+EVENT_COLUMNS = tuple(getattr(Event, name) for name in EVENT_FIELDS)
+
+def select_events():
+    """
+    One narrow SELECT for event responses: the event columns plus only the
+    creator's name, instead of loading whole User rows in a second query.
+    """
+    return (
+        select(*EVENT_COLUMNS, User.name.label("created_by_name"))
+        .outerjoin(User, User.id == Event.created_by_id)
+    )
+
+def event_to_dict(row, creator_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Response document for a row from select_events(), or for a row of
+    EVENT_COLUMNS (e.g. from RETURNING) and its creator's name.
+    """
+    data = dict(zip(EVENT_FIELDS, row))
+    if creator_name is None:
+        creator_name = getattr(row, "created_by_name", None)
+    data["created_by"] = (
+        {"id": data["created_by_id"], "name": creator_name} if creator_name is not None else None
+    )
+    return data
+
+def check_time_format(value: str) -> str:
+    """Reject anything that is not an HH:MM time with a 422; returns it zero-padded."""
+    try:
+        return validate_time_format(value)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid time format: {str(e)}. Please use HH:MM format."
+        )
+
+def invalidate_on_remote_change(change: Change) -> None:
+    """Another worker changed events, so this worker's cached responses are stale."""
+    events_response_cache.invalidate()
+    if change.event_id is not None:
+        event_detail_cache.invalidate(change.event_id)
+
+change_feed.on_remote_change(invalidate_on_remote_change)
+
+async def get_creator_name(db: AsyncSession, user_id: Optional[int]) -> Optional[str]:
+    """An event creator's name, from the user cache when it is there."""
+    if user_id is None:
+        return None
+    user = await get_cached_user(user_id)
+    if user is None:
+        user = await repository.users.get(db, user_id, User.name)
+    return user.name if user is not None else None
+
+def render_event(row, creator_name: Optional[str] = None) -> CachedResponse:
+    """Render an event row (see event_to_dict) into a cacheable response."""
+    data = event_to_dict(row, creator_name)
+    if settings.FAST_JSON_RESPONSES:
+        body = dumps(data)
+    else:
+        body = EventSchema.model_validate(data).model_dump_json().encode()
+    return CachedResponse.from_body(body, row.updated_at)
+
 @router.get("/", response_model=List[EventSchema])
 async def read_events(
     request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    search: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    starts_from: Optional[datetime] = None,
+    starts_to: Optional[datetime] = None,
+    time_from: Optional[str] = None,
+    time_to: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-    current_user: UserInDB = Depends(get_current_active_user)
+    current_user: TokenPrincipal = Depends(get_current_active_principal)
 ):
     """
-    Retrieve all events with pagination.
+    Retrieve events ordered by (date, id).
+    
+    `search` matches title or description; `start_date`/`end_date` bound the
+    event date and `starts_from`/`starts_to` the start moment (inclusive).
+    `time_from`/`time_to` (HH:MM) bound the start time of day, e.g. events
+    starting between 09:00 and 12:00 this week.
+    
+    Pass the `X-Next-Cursor` response header back as `cursor` to fetch the
+    following page with a keyset seek; `skip` is ignored in that case.
+    
+    Responses are cached per query string and carry ETag/Last-Modified, so
+    conditional requests get a 304 without a database round trip.
     """
-    # Eager load the created_by relationship to avoid N+1 queries
-    result = await db.execute(
-        select(Event)
-        .options(selectinload(Event.created_by))
-        .offset(skip)
-        .limit(limit)
+    cache_key = events_response_cache.key_for(request)
+    cached = events_response_cache.get(cache_key)
+    if cached is not None:
+        return cached.to_response(request)
+    seen_version = events_response_cache.version.version
+    
+    query = select_events().order_by(Event.date, Event.id).limit(limit)
+    query = apply_event_filters(
+        query, search=search, start_date=start_date, end_date=end_date,
+        starts_from=starts_from, starts_to=starts_to,
+        time_from=time_from and check_time_format(time_from),
+        time_to=time_to and check_time_format(time_to)
     )
-    events = result.scalars().all()
-    return events
+    
+    if cursor:
+        try:
+            after_date, after_id = decode_cursor(cursor)
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        query = query.filter(tuple_(Event.date, Event.id) > tuple_(after_date, after_id))
+    else:
+        query = query.offset(skip)
+    
+    events = (await db.execute(query)).all()
+    documents = [event_to_dict(row) for row in events]
+    if settings.FAST_JSON_RESPONSES:
+        body = dumps(documents)
+    else:
+        body = event_list_adapter.dump_json(event_list_adapter.validate_python(documents))
+    
+    # A full page means there may be more rows after the last one
+    headers = {}
+    if limit > 0 and len(events) == limit:
+        last = events[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.date, last.id)
+    entry = events_response_cache.store(cache_key, body, seen_version, headers=headers)
+    return entry.to_response(request)
 
 @router.post("/", response_model=EventSchema, status_code=status.HTTP_201_CREATED)
 async def create_event(
@@ -47,94 +194,519 @@ async def create_event(
     """
     Create a new event (admin only).
     """
-    # Convert time string to time object
+    # Validate time format (HH:MM)
+    check_time_format(event_in.time)
+    
+    # Create the event, reading back server-generated columns with RETURNING
+    row = await repository.events.create(
+        db, {**event_in.dict(), "created_by_id": current_user.id}, *EVENT_COLUMNS
+    )
+    await db.commit()
+    events_response_cache.invalidate()
+    
+    data = event_to_dict(row, current_user.name)
+    await change_feed.publish("created", data["id"], data)
+    
+    return data
+
+@router.post(
+    "/bulk",
+    response_model=BulkImportResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def bulk_import_events(
+    request: Request,
+    format: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_admin_user)
+):
+    """
+    Import many events at once (admin only).
+    
+    The body is NDJSON (one event object per line) or CSV with a header row,
+    chosen by `format` (`ndjson`/`csv`) or the Content-Type. Rows are
+    validated like single creates and inserted in chunks; invalid rows are
+    skipped and reported by row number.
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "csv" if "csv" in content_type else "ndjson"
+    if format not in ("ndjson", "csv"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="format must be 'ndjson' or 'csv'"
+        )
+    
     try:
-        # Validate time format (HH:MM)
-        time_parts = event_in.time.split(":")
-        if len(time_parts) != 2 or not all(part.isdigit() for part in time_parts):
-            raise ValueError("Time must be in HH:MM format")
-        hours, minutes = map(int, time_parts)
-        if not (0 <= hours < 24 and 0 <= minutes < 60):
-            raise ValueError("Invalid time")
-    except ValueError as e:
+        text = (await request.body()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Body must be UTF-8 encoded"
+        )
+    
+    records = parse_csv(text) if format == "csv" else parse_ndjson(text)
+    result = await import_events(
+        db,
+        records,
+        created_by_id=current_user.id,
+        chunk_size=settings.BULK_IMPORT_CHUNK_SIZE,
+        use_copy=settings.BULK_IMPORT_USE_COPY,
+        max_errors=settings.BULK_IMPORT_MAX_ERRORS
+    )
+    
+    if result.inserted:
+        events_response_cache.invalidate()
+        await change_feed.publish("imported")
+    
+    return result
+
+@router.post("/batch", response_model=EventBatchResult)
+async def batch_events(
+    batch: EventBatch,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_admin_user)
+):
+    """
+    Apply many updates and deletes in one request and one transaction (admin only).
+    
+    Each operation is `{"op": "update", "id": ..., "data": {...}}` or
+    `{"op": "delete", "id": ...}`; `data` takes the same fields as
+    PUT /events/{id}. Results are reported per operation, in order.
+    
+    With `atomic` (the default) nothing is applied if any operation is
+    invalid and the response is a 422 whose detail holds the per-operation
+    results; otherwise the valid operations are applied and the invalid
+    ones reported.
+    """
+    if len(batch.operations) > settings.BATCH_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"A batch may hold at most {settings.BATCH_MAX_OPERATIONS} operations"
+        )
+    
+    result = await apply_event_batch(db, batch.operations, atomic=batch.atomic)
+    if batch.atomic and result.failed:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Invalid time format: {str(e)}. Please use HH:MM format."
+            detail=jsonable_encoder(result)
         )
+    if not result.applied:
+        return result
+    
+    events_response_cache.invalidate()
+    applied = [item for item in result.results if item.ok]
+    updated_ids = [item.id for item in applied if item.op == "update"]
+    events = {}
+    if updated_ids:
+        rows = await db.execute(select_events().filter(Event.id.in_(updated_ids)))
+        events = {row.id: event_to_dict(row) for row in rows}
+    
+    for item in applied:
+        event_detail_cache.invalidate(item.id)
+        if item.op == "update":
+            item.event = EventSchema.model_validate(events[item.id])
+            await change_feed.publish("updated", item.id, events[item.id])
+        else:
+            await change_feed.publish("deleted", item.id)
     
-    # Create the event
-    db_event = Event(
-        **event_in.dict(exclude={"time"}),
-        time=event_in.time,  # Store as string in HH:MM format
-        created_by_id=current_user.id
+    return result
+
+# Export columns: the event response fields plus the creator's name, joined in SQL
+EXPORT_FIELDS = EVENT_FIELDS + ("created_by_name",)
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+async def stream_event_export(query, format: str) -> AsyncIterator[bytes]:
+    """
+    Encode events from a server-side cursor, one chunk per fetched batch.
+    
+    StreamingResponse only pulls the next chunk once the previous one has been
+    handed to the server, so a slow client pauses the cursor instead of
+    buffering rows in memory.
+    """
+    # Opened here rather than through get_db, so mark it for replica routing the same way
+    async with async_session_maker(info={"read_only": True}) as session:
+        result = await session.stream(
+            query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+        )
+        if format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_FIELDS)
+            async for rows in result.partitions():
+                writer.writerows(
+                    ["" if value is None else value.isoformat() if isinstance(value, datetime) else value
+                     for value in row]
+                    for row in rows
+                )
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue().encode()
+        else:
+            async for rows in result.partitions():
+                yield b"".join(
+                    dumps(dict(zip(EXPORT_FIELDS, row))) + b"\n" for row in rows
+                )
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_events(
+    format: str = "ndjson",
+    search: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    starts_from: Optional[datetime] = None,
+    starts_to: Optional[datetime] = None,
+    time_from: Optional[str] = None,
+    time_to: Optional[str] = None,
+    current_user: TokenPrincipal = Depends(get_current_active_principal)
+):
+    """
+    Stream every event (optionally filtered) as NDJSON or CSV.
+    
+    Memory use stays flat regardless of table size; rows are read through a
+    server-side cursor in batches of EXPORT_BATCH_SIZE.
+    """
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="format must be 'ndjson' or 'csv'"
+        )
+    
+    query = select_events().order_by(Event.date, Event.id)
+    query = apply_event_filters(
+        query, search=search, start_date=start_date, end_date=end_date,
+        starts_from=starts_from, starts_to=starts_to,
+        time_from=time_from and check_time_format(time_from),
+        time_to=time_to and check_time_format(time_to)
     )
     
-    db.add(db_event)
-    await db.commit()
-    await db.refresh(db_event)
+    return StreamingResponse(
+        stream_event_export(query, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="events.{format}"'}
+    )
+
+def sse_message(type: str, seq: int, data: Dict[str, Any]) -> bytes:
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (seq, type.encode(), dumps(data))
+
+async def stream_changes(after: Optional[int]) -> AsyncIterator[bytes]:
+    """
+    Replay missed changes, then forward live ones until the client leaves.
+    
+    A `reset` message means changes were missed (the resume point is too old,
+    or a gap was seen) and the client should refetch the list.
+    """
+    broker = change_feed.broker
+    subscription = broker.subscribe(after)
+    try:
+        yield b"retry: 3000\n\n"
+        last_seq = after
+        if subscription.reset:
+            last_seq = broker.last_seq
+            yield sse_message("reset", last_seq, {"seq": last_seq})
+        
+        def render(change: Change) -> bytes:
+            nonlocal last_seq
+            message = b""
+            if last_seq is not None and change.seq != last_seq + 1:
+                message = sse_message("reset", change.seq - 1, {"seq": change.seq - 1})
+            last_seq = change.seq
+            return message + sse_message(change.type, change.seq, {
+                "seq": change.seq,
+                "type": change.type,
+                "event_id": change.event_id,
+                "event": change.event,
+            })
+        
+        for change in subscription.replay:
+            yield render(change)
+        
+        while True:
+            if subscription.dropped.is_set() and subscription.queue.empty():
+                # Too slow to keep up; the client reconnects with
+                # Last-Event-ID and catches up from history
+                return
+            try:
+                change = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=settings.CHANGE_FEED_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            yield render(change)
+    finally:
+        broker.unsubscribe(subscription)
+
+@router.get("/changes", response_class=StreamingResponse)
+async def event_changes(
+    request: Request,
+    after: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenPrincipal = Depends(get_current_active_principal)
+):
+    """
+    Stream created/updated/deleted events as Server-Sent Events.
     
-    # Eager load the created_by relationship
-    result = await db.execute(
-        select(Event)
-        .options(selectinload(Event.created_by))
-        .filter(Event.id == db_event.id)
+    Each message's `id` is its sequence number. To resume after a reconnect,
+    send it back as `Last-Event-ID` (EventSource does this automatically) or
+    as `after`; missed changes still in history are replayed first.
+    """
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id:
+        try:
+            after = int(last_event_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Last-Event-ID must be a sequence number"
+            )
+    
+    # Don't keep a pooled connection for the lifetime of the stream
+    await db.close()
+    
+    return StreamingResponse(
+        stream_changes(after),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
-    db_event = result.scalars().first()
+
+def occurrence_to_dict(
+    event: Dict[str, Any],
+    occurrence_start: datetime,
+    override: Optional[EventOccurrenceOverride] = None
+) -> Dict[str, Any]:
+    """Response document for one occurrence of `event` (from event_to_dict())."""
+    data = {
+        "event_id": event["id"],
+        "occurrence_start": occurrence_start,
+        "date": occurrence_start,
+        "time": event["time"],
+        "title": event["title"],
+        "description": event["description"],
+        "image_url": event["image_url"],
+        "recurrence_rule": event["recurrence_rule"],
+        "overridden": override is not None,
+        "created_by": event["created_by"],
+    }
+    if override is not None:
+        for field in ("title", "description", "time", "image_url"):
+            value = getattr(override, field)
+            if value is not None:
+                data[field] = value
+        if override.date is not None:
+            data["date"] = as_utc(override.date)
+    return data
+
+async def expand_occurrences(
+    db: AsyncSession,
+    start: datetime,
+    end: datetime
+) -> List[Dict[str, Any]]:
+    """
+    Every occurrence starting within [start, end], ordered by date.
     
-    return db_event
+    Only series overlapping the window (via recurrence_until) or with an
+    occurrence moved into it are read, and each is expanded from the
+    window's start rather than its first occurrence, so the cost follows
+    the window, not the series length.
+    """
+    query = select_events().filter(or_(
+        and_(
+            Event.recurrence_rule.is_(None),
+            or_(
+                Event.starts_at.between(start, end),
+                # Rows not backfilled yet
+                and_(Event.starts_at.is_(None), Event.date.between(start, end))
+            )
+        ),
+        and_(
+            Event.recurrence_rule.is_not(None),
+            or_(
+                and_(
+                    or_(Event.starts_at <= end, and_(Event.starts_at.is_(None), Event.date <= end)),
+                    or_(Event.recurrence_until.is_(None), Event.recurrence_until >= start)
+                ),
+                # Series with an occurrence moved into the window from outside
+                # it; correlated on event_id so (event_id, date) is the index
+                select(EventOccurrenceOverride.id).filter(
+                    EventOccurrenceOverride.event_id == Event.id,
+                    EventOccurrenceOverride.date.between(start, end)
+                ).exists()
+            )
+        )
+    ))
+    rows = (await db.execute(query.add_columns(Event.recurrence_until))).all()
+    
+    series = [row for row in rows if row.recurrence_rule]
+    overrides: Dict[tuple, EventOccurrenceOverride] = {}
+    if series:
+        # Overrides of occurrences in the window, and of ones moved into it
+        result = await db.execute(select(EventOccurrenceOverride).filter(
+            EventOccurrenceOverride.event_id.in_([row.id for row in series]),
+            or_(
+                and_(EventOccurrenceOverride.occurrence_start >= start,
+                     EventOccurrenceOverride.occurrence_start <= end),
+                and_(EventOccurrenceOverride.date >= start, EventOccurrenceOverride.date <= end)
+            )
+        ))
+        for override in result.scalars():
+            overrides[override.event_id, as_utc(override.occurrence_start)] = override
+    
+    documents = []
+    for row in rows:
+        event = event_to_dict(row)
+        if not row.recurrence_rule:
+            documents.append(occurrence_to_dict(event, as_utc(row.starts_at or row.date)))
+            continue
+        
+        for occurrence_start in occurrence_cache.expand(
+            row.recurrence_rule, row.starts_at or row.date, row.recurrence_until, start, end
+        ):
+            override = overrides.pop((row.id, occurrence_start), None)
+            if override is not None and override.cancelled:
+                continue
+            documents.append(occurrence_to_dict(event, occurrence_start, override))
+        
+        # Occurrences from outside the window that were moved into it
+        for (event_id, occurrence_start), override in list(overrides.items()):
+            if event_id == row.id and not override.cancelled and override.date is not None:
+                documents.append(occurrence_to_dict(event, occurrence_start, override))
+    
+    # Drop occurrences moved out of the window
+    documents = [doc for doc in documents if as_utc(start) <= doc["date"] <= as_utc(end)]
+    documents.sort(key=lambda doc: (doc["date"], doc["event_id"]))
+    return documents
 
-@router.put("/{event_id}", response_model=EventSchema)
-async def update_event(
+@router.get("/occurrences", response_model=List[EventOccurrence])
+async def read_occurrences(
+    request: Request,
+    start: datetime,
+    end: datetime,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenPrincipal = Depends(get_current_active_principal)
+):
+    """
+    Occurrences of one-off and recurring events starting between `start`
+    and `end` (inclusive), with cancelled occurrences left out and
+    overrides applied.
+    
+    The window may span at most OCCURRENCE_WINDOW_MAX_DAYS days. Responses
+    are cached like the event list.
+    """
+    if end < start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must not be before start"
+        )
+    if as_utc(end) - as_utc(start) > timedelta(days=settings.OCCURRENCE_WINDOW_MAX_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The window may span at most {settings.OCCURRENCE_WINDOW_MAX_DAYS} days"
+        )
+    
+    cache_key = events_response_cache.key_for(request)
+    cached = events_response_cache.get(cache_key)
+    if cached is not None:
+        return cached.to_response(request)
+    seen_version = events_response_cache.version.version
+    
+    documents = await expand_occurrences(db, start, end)
+    if settings.FAST_JSON_RESPONSES:
+        body = dumps(documents)
+    else:
+        body = occurrence_list_adapter.dump_json(occurrence_list_adapter.validate_python(documents))
+    
+    entry = events_response_cache.store(cache_key, body, seen_version)
+    return entry.to_response(request)
+
+@router.get("/{event_id}", response_model=EventSchema)
+async def read_event(
     event_id: int,
-    event_in: EventUpdate,
     request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: UserInDB = Depends(get_current_admin_user)
+    current_user: TokenPrincipal = Depends(get_current_active_principal)
 ):
     """
-    Update an event (admin only).
+    Retrieve a single event.
+    
+    Reads go through a per-event cache; concurrent misses for the same id
+    share one database query.
     """
-    # Get the event with the created_by relationship loaded
-    result = await db.execute(
-        select(Event)
-        .options(selectinload(Event.created_by))
-        .filter(Event.id == event_id)
-    )
-    db_event = result.scalars().first()
+    async def load_event() -> Optional[CachedResponse]:
+        result = await db.execute(select_events().filter(Event.id == event_id))
+        row = result.first()
+        return render_event(row) if row is not None else None
     
-    if not db_event:
+    entry = await event_detail_cache.get_or_load(event_id, load_event)
+    
+    if entry is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
     
-    # Update event data
+    return entry.to_response(request)
+
+@router.put("/{event_id}", response_model=EventSchema)
+async def update_event(
+    event_id: int,
+    event_in: EventUpdate,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_admin_user)
+):
+    """
+    Update an event (admin only).
+    """
     update_data = event_in.dict(exclude_unset=True)
     
     # If time is being updated, validate it
     if "time" in update_data:
-        try:
-            time_parts = update_data["time"].split(":")
-            if len(time_parts) != 2 or not all(part.isdigit() for part in time_parts):
-                raise ValueError("Time must be in HH:MM format")
-            hours, minutes = map(int, time_parts)
-            if not (0 <= hours < 24 and 0 <= minutes < 60):
-                raise ValueError("Invalid time")
-        except ValueError as e:
+        check_time_format(update_data["time"])
+    for field in REQUIRED_FIELDS:
+        if field in update_data and update_data[field] is None:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid time format: {str(e)}. Please use HH:MM format."
+                detail=f"{field} cannot be null"
             )
     
-    # Update the event
-    for field, value in update_data.items():
-        setattr(db_event, field, value)
+    # Update the event and read it back in the same statement
+    if update_data:
+        row = await repository.events.update(db, event_id, update_data, *EVENT_COLUMNS)
+    else:
+        row = await repository.events.get(db, event_id, *EVENT_COLUMNS)
+    
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+    
+    if update_data.keys() & set(repository.EventRepository.START_FIELDS):
+        # The occurrences overrides refer to may no longer exist
+        await db.execute(
+            delete(EventOccurrenceOverride).where(EventOccurrenceOverride.event_id == event_id)
+        )
     
-    db.add(db_event)
     await db.commit()
-    await db.refresh(db_event)
+    events_response_cache.invalidate()
     
-    return db_event
+    creator_name = await get_creator_name(db, row.created_by_id)
+    event_detail_cache.set(event_id, render_event(row, creator_name))
+    data = event_to_dict(row, creator_name)
+    await change_feed.publish("updated", event_id, data)
+    
+    return data
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_event(
@@ -146,17 +718,104 @@ async def delete_event(
     """
     Delete an event (admin only).
     """
-    # Get the event
-    result = await db.execute(select(Event).filter(Event.id == event_id))
-    db_event = result.scalars().first()
+    await db.execute(
+        delete(EventOccurrenceOverride).where(EventOccurrenceOverride.event_id == event_id)
+    )
+    if not await repository.events.delete(db, event_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+    await db.commit()
+    events_response_cache.invalidate()
+    event_detail_cache.invalidate(event_id)
+    await change_feed.publish("deleted", event_id)
+    
+    return None
+
+async def get_recurring_event(db: AsyncSession, event_id: int, occurrence_start: datetime) -> Event:
+    """Load a recurring event, checking that `occurrence_start` is one of its occurrences."""
+    db_event = await repository.events.get(db, event_id)
     
     if not db_event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
+    if not db_event.recurrence_rule:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Event is not recurring"
+        )
+    
+    rule = RecurrenceRule.parse(db_event.recurrence_rule)
+    occurrence_start = as_utc(occurrence_start)
+    if occurrence_start not in occurrences(
+        rule, db_event.starts_at or db_event.date, occurrence_start, occurrence_start,
+        db_event.recurrence_until
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Occurrence not found"
+        )
+    return db_event
+
+@router.put("/{event_id}/occurrences/{occurrence_start}", response_model=EventOccurrence)
+async def override_occurrence(
+    event_id: int,
+    occurrence_start: datetime,
+    override_in: EventOccurrenceOverrideSchema,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_admin_user)
+):
+    """
+    Cancel, move or change one occurrence of a recurring event (admin only).
+    
+    `occurrence_start` is the start the rule generates for the occurrence.
+    Replaces any earlier override of the same occurrence.
+    """
+    if override_in.time is not None:
+        check_time_format(override_in.time)
+    await get_recurring_event(db, event_id, occurrence_start)
+    occurrence_start = as_utc(occurrence_start)
+    
+    existing = await repository.occurrence_overrides.get_by(
+        db, EventOccurrenceOverride.id, event_id=event_id, occurrence_start=occurrence_start
+    )
+    if existing is None:
+        override = await repository.occurrence_overrides.create(
+            db, {"event_id": event_id, "occurrence_start": occurrence_start, **override_in.dict()}
+        )
+    else:
+        override = await repository.occurrence_overrides.update(db, existing.id, override_in.dict())
+    await db.commit()
+    events_response_cache.invalidate()
+    
+    result = await db.execute(select_events().filter(Event.id == event_id))
+    event = event_to_dict(result.one())
+    await change_feed.publish("updated", event_id, event)
+    
+    return occurrence_to_dict(event, occurrence_start, override)
+
+@router.delete("/{event_id}/occurrences/{occurrence_start}", status_code=status.HTTP_204_NO_CONTENT)
+async def restore_occurrence(
+    event_id: int,
+    occurrence_start: datetime,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_admin_user)
+):
+    """
+    Remove the override of one occurrence, restoring it as the rule
+    generates it (admin only).
+    """
+    await get_recurring_event(db, event_id, occurrence_start)
     
-    await db.delete(db_event)
+    await db.execute(delete(EventOccurrenceOverride).where(
+        EventOccurrenceOverride.event_id == event_id,
+        EventOccurrenceOverride.occurrence_start == as_utc(occurrence_start)
+    ))
     await db.commit()
+    events_response_cache.invalidate()
+    await change_feed.publish("updated", event_id)
     
     return None
@@ -0,0 +1,177 @@
+import asyncio
+import logging
+from typing import Iterable, List
+
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy import text
+
+from ...core.change_feed import change_feed
+from ...core.config import settings
+from ...core.hashing import password_hasher
+from ...core.http_cache import events_response_cache, event_detail_cache
+from ...core.recurrence import occurrence_cache
+from ...core.metrics import (
+    Sample,
+    counter_sample,
+    gauge,
+    merge_snapshots,
+    registry,
+    render,
+    write_snapshot
+)
+from ...core.revocation import revocation_list
+from ...core.tokens import token_verifier
+from ...core.user_cache import user_cache
+from ...db.base import engine, get_pool_stats, replicas
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Caches whose hit ratios are exported, by label
+CACHES = {
+    "user": user_cache,
+    "token": token_verifier.cache,
+    "events_list": events_response_cache,
+    "event_detail": event_detail_cache,
+    "occurrences": occurrence_cache,
+}
+
+def collect_runtime_metrics() -> Iterable[Sample]:
+    """Pool, hashing executor and cache figures read at scrape time."""
+    pool = get_pool_stats()
+    if "checked_out" in pool:
+        yield gauge("db_pool_size", pool["size"])
+        yield gauge("db_pool_checked_out", pool["checked_out"])
+        yield gauge("db_pool_overflow", pool["overflow"])
+        yield counter_sample("db_pool_checkouts_total", pool["checkouts"])
+        yield counter_sample("db_pool_overflow_hits_total", pool["overflow_hits"])
+        yield counter_sample("db_pool_timeouts_total", pool["timeouts"])
+        yield counter_sample("db_pool_wait_seconds_total", pool["wait_time_total"])
+
+    hasher = password_hasher.stats()
+    yield gauge("password_hasher_queue_depth", hasher["queue_depth"])
+    yield gauge("password_hasher_in_flight", hasher["in_flight"])
+    yield counter_sample("password_hasher_completed_total", hasher["completed"])
+    yield counter_sample("password_hasher_rejected_total", hasher["rejected"])
+    yield counter_sample("password_hasher_seconds_total", hasher["latency_total"])
+
+    for replica in replicas.stats():
+        yield gauge("db_replica_healthy", replica["healthy"], replica=replica["name"])
+        yield gauge("db_replica_checked_out", replica["checked_out"], replica=replica["name"])
+        yield counter_sample("db_replica_failures_total", replica["failures"], replica=replica["name"])
+    
+    feed = change_feed.broker.stats()
+    yield gauge("change_feed_subscribers", feed["subscribers"])
+    yield counter_sample("change_feed_delivered_total", feed["delivered"])
+    yield counter_sample("change_feed_dropped_subscribers_total", feed["dropped"])
+    
+    revocations = revocation_list.stats()
+    yield gauge("revoked_tokens", revocations["tokens"])
+    yield gauge("revoked_users", revocations["users"])
+    yield counter_sample("revocation_sync_failures_total", revocations["sync_failures"])
+    
+    for name, cache in CACHES.items():
+        stats = cache.stats()
+        yield counter_sample("cache_hits_total", stats["hits"], cache=name)
+        yield counter_sample("cache_misses_total", stats["misses"], cache=name)
+        yield gauge("cache_entries", stats["size"], cache=name)
+
+registry.register_collector(collect_runtime_metrics, help={
+    "db_pool_size": "Connections the pool keeps open",
+    "db_pool_checked_out": "Connections currently in use",
+    "db_pool_overflow": "Connections open beyond the pool size",
+    "db_pool_checkouts_total": "Connection checkouts",
+    "db_pool_overflow_hits_total": "Checkouts that had to open an overflow connection",
+    "db_pool_timeouts_total": "Checkouts that timed out waiting for a connection",
+    "db_pool_wait_seconds_total": "Time spent waiting for connections",
+    "db_replica_healthy": "1 if the read replica is in rotation, 0 if ejected",
+    "db_replica_checked_out": "Replica connections currently in use",
+    "db_replica_failures_total": "Replica connection errors and failed health checks",
+    "password_hasher_queue_depth": "Hashes waiting for a free worker",
+    "password_hasher_in_flight": "Hashes queued or running",
+    "password_hasher_completed_total": "Hashes and verifications completed",
+    "password_hasher_rejected_total": "Hashes rejected because the queue was full",
+    "password_hasher_seconds_total": "Time spent hashing, including queueing",
+    "change_feed_subscribers": "Open change feed streams",
+    "change_feed_delivered_total": "Changes queued to change feed subscribers",
+    "change_feed_dropped_subscribers_total": "Change feed subscribers dropped for falling behind",
+    "revoked_tokens": "Individually revoked tokens not yet expired",
+    "revoked_users": "Users whose earlier tokens are all revoked",
+    "revocation_sync_failures_total": "Failed refreshes of the revocation list",
+    "cache_hits_total": "Cache lookups that found an entry",
+    "cache_misses_total": "Cache lookups that missed",
+    "cache_entries": "Entries currently cached",
+    "cache_hit_ratio": "Hits over lookups since start",
+})
+
+def with_hit_ratios(samples: List[Sample]) -> List[Sample]:
+    """Derive cache_hit_ratio after aggregation so it is correct across workers."""
+    hits, misses = {}, {}
+    for sample in samples:
+        if sample.name == "cache_hits_total":
+            hits[sample.labels] = sample.value
+        elif sample.name == "cache_misses_total":
+            misses[sample.labels] = sample.value
+    for labels, hit_count in hits.items():
+        lookups = hit_count + misses.get(labels, 0)
+        samples.append(Sample(
+            "cache_hit_ratio", "gauge", "cache_hit_ratio", labels,
+            hit_count / lookups if lookups else 0.0
+        ))
+    return samples
+
+def flush_metrics() -> None:
+    """Write this worker's samples for the multi-process aggregator."""
+    write_snapshot(settings.METRICS_MULTIPROC_DIR, registry.collect())
+
+async def flush_metrics_periodically() -> None:
+    while True:
+        await asyncio.sleep(settings.METRICS_FLUSH_SECONDS)
+        try:
+            flush_metrics()
+        except OSError:
+            logger.exception("Could not write metrics snapshot")
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus scrape endpoint."""
+    if settings.METRICS_MULTIPROC_DIR:
+        flush_metrics()
+        samples = merge_snapshots(settings.METRICS_MULTIPROC_DIR)
+    else:
+        samples = registry.collect()
+    return PlainTextResponse(
+        render(with_hit_ratios(samples), registry.help),
+        media_type="text/plain; version=0.0.4"
+    )
+
+@router.get("/health/ready")
+async def readiness_check():
+    """Report ready only if the database answers a trivial query."""
+    async def probe() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    try:
+        await asyncio.wait_for(probe(), timeout=settings.READINESS_TIMEOUT_SECONDS)
+    except Exception as e:
+        logger.warning("Readiness check failed: %s", e)
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable", "database": "unreachable"}
+        )
+    return {"status": "ready", "database": "ok"}
+
+@router.get("/health/pool")
+async def pool_stats():
+    return get_pool_stats()
+
+@router.get("/health/replicas")
+async def replica_stats():
+    return replicas.stats()
+
+@router.get("/health/hasher")
+async def hasher_stats():
+    return password_hasher.stats()
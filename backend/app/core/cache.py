@@ -0,0 +1,170 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    In-process LRU cache whose entries expire after a TTL.
+
+    Not thread-safe; it is meant to be used from the event loop only.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class ReadThroughCache:
+    """
+    TTLCache that loads missing keys through a callback.
+
+    Concurrent misses for the same key are coalesced: the first caller runs
+    the loader and everyone else awaits its result. ``None`` results are
+    passed through but never cached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._writes = 0
+        self.coalesced = 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            value = self._cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The request running the loader went away; try again
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        writes = self._writes
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved in case nobody was waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        # A set() or invalidate() during the load means the value may be stale
+        if value is not None and writes == self._writes:
+            self._cache.set(key, value)
+        future.set_result(value)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Write a fresh value through to the cache."""
+        self._writes += 1
+        self._cache.set(key, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._writes += 1
+        self._cache.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._cache.stats(), "coalesced": self.coalesced}
+
+
+class CacheBackend(ABC):
+    """Shared cache store used as a second tier behind a TTLCache."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+
+class LocalCacheBackend(CacheBackend):
+    """In-memory stand-in for a shared store such as Redis."""
+
+    def __init__(self, maxsize: int = 100_000):
+        self._cache = TTLCache(maxsize=maxsize, ttl=0)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+
+def create_cache_backend(name: str) -> Optional[CacheBackend]:
+    """Build the shared cache backend configured by name, if any."""
+    if not name:
+        return None
+    if name == "local":
+        return LocalCacheBackend()
+    raise ValueError(f"Unknown cache backend: {name}")
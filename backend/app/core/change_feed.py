@@ -0,0 +1,271 @@
+"""
+Change feed for events: write handlers publish, SSE subscribers receive.
+
+Publishing goes through a transport that assigns the sequence number and
+delivers the change to every worker's broker. The local transport only
+reaches this process; the Postgres transport uses NOTIFY/LISTEN so every
+worker sees every change, in the same order and with the same numbers,
+which lets a client resume on any worker.
+"""
+import asyncio
+import json
+import logging
+import secrets
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.engine.url import make_url
+
+from .config import settings
+from .serialization import dumps
+from ..db.base import engine
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Change:
+    seq: int
+    type: str  # "created", "updated", "deleted" or "imported"
+    event_id: Optional[int]
+    event: Optional[Dict[str, Any]]
+    origin: str  # Boot id of the publishing process
+    at: float
+
+class Subscription:
+    def __init__(self, maxsize: int, replay: List[Change], reset: bool):
+        self.queue: "asyncio.Queue[Change]" = asyncio.Queue(maxsize=maxsize)
+        self.replay = replay
+        self.reset = reset  # The requested resume point is no longer available
+        self.dropped = asyncio.Event()
+
+class ChangeBroker:
+    """
+    In-process fan-out with a bounded queue per subscriber.
+
+    A subscriber whose queue fills up is dropped rather than allowed to
+    hold up everyone else or grow without bound; its stream ends and the
+    client resumes from its last sequence number using the history.
+    """
+
+    def __init__(self, queue_size: int, history_size: int):
+        self.queue_size = queue_size
+        self.history: Deque[Change] = deque(maxlen=history_size)
+        self.subscribers: Set[Subscription] = set()
+        self.last_seq = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def dispatch(self, change: Change) -> None:
+        self.history.append(change)
+        self.last_seq = change.seq
+        for subscription in list(self.subscribers):
+            try:
+                subscription.queue.put_nowait(change)
+                self.delivered += 1
+            except asyncio.QueueFull:
+                self.dropped += 1
+                self.subscribers.discard(subscription)
+                subscription.dropped.set()
+
+    def subscribe(self, after: Optional[int]) -> Subscription:
+        """
+        Register a subscriber, replaying history after sequence `after`.
+
+        No await happens between taking the snapshot and registering, so a
+        change is either replayed or queued, never both or neither.
+        """
+        replay: List[Change] = []
+        reset = False
+        if after is not None:
+            oldest = self.history[0].seq if self.history else self.last_seq + 1
+            if after > self.last_seq or after < oldest - 1:
+                # From the future (e.g. after a restart) or already evicted
+                reset = True
+            else:
+                replay = [change for change in self.history if change.seq > after]
+        subscription = Subscription(self.queue_size, replay, reset)
+        self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self.subscribers.discard(subscription)
+
+    def clear_history(self) -> None:
+        """Forget history that may have gaps, forcing resuming clients to reset."""
+        self.history.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "subscribers": len(self.subscribers),
+            "last_seq": self.last_seq,
+            "history": len(self.history),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+Deliver = Callable[[Change], None]
+
+class ChangeTransport(ABC):
+    @abstractmethod
+    async def start(self, deliver: Deliver) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, type: str, event_id: Optional[int], event: Optional[Dict[str, Any]], origin: str) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+class LocalTransport(ChangeTransport):
+    """Single-process transport; sequence numbers restart with the process."""
+
+    def __init__(self) -> None:
+        self._deliver: Optional[Deliver] = None
+        self._seq = 0
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    async def publish(self, type, event_id, event, origin) -> None:
+        self._seq += 1
+        if self._deliver is not None:
+            self._deliver(Change(self._seq, type, event_id, event, origin, time.time()))
+
+class PostgresTransport(ChangeTransport):
+    """
+    NOTIFY/LISTEN transport shared by every worker.
+
+    Publishing takes a transaction-scoped advisory lock around nextval() and
+    pg_notify(), so sequence order matches the order notifications are
+    delivered in. Each worker listens on its own dedicated connection and
+    reconnects if it drops; changes sent meanwhile are lost, so history is
+    cleared and resuming clients are told to reset.
+    """
+
+    CHANNEL = "event_changes"
+    SEQUENCE = "event_change_seq"
+    LOCK_KEY = 0x6576656E  # Arbitrary advisory lock id for publishers
+
+    def __init__(self, engine, database_url: str, on_reconnect: Callable[[], None]):
+        self.engine = engine
+        # asyncpg wants a plain postgresql:// DSN
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.on_reconnect = on_reconnect
+        self._deliver: Optional[Deliver] = None
+        self._connection = None
+        self._supervisor: Optional[asyncio.Task] = None
+        self._lost = asyncio.Event()
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        if self._deliver is not None:
+            self._deliver(Change(**json.loads(payload)))
+
+    async def _listen(self) -> None:
+        import asyncpg
+
+        self._connection = await asyncpg.connect(self.dsn)
+        self._connection.add_termination_listener(lambda connection: self._lost.set())
+        await self._connection.add_listener(self.CHANNEL, self._on_notify)
+
+    async def _supervise(self) -> None:
+        while True:
+            await self._lost.wait()
+            logger.warning("Change feed listener connection lost, reconnecting")
+            self._lost.clear()
+            self.on_reconnect()
+            delay = 0.5
+            while True:
+                try:
+                    await self._listen()
+                    break
+                except Exception:
+                    logger.exception("Change feed listener could not reconnect")
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 30.0)
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+        async with self.engine.begin() as conn:
+            await conn.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {self.SEQUENCE}"))
+        await self._listen()
+        self._supervisor = asyncio.create_task(self._supervise())
+
+    async def publish(self, type, event_id, event, origin) -> None:
+        async with self.engine.begin() as conn:
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": self.LOCK_KEY})
+            seq = await conn.scalar(text(f"SELECT nextval('{self.SEQUENCE}')"))
+            change = Change(seq, type, event_id, event, origin, time.time())
+            await conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.CHANNEL, "payload": json.dumps(asdict(change))}
+            )
+
+    async def stop(self) -> None:
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._supervisor
+        if self._connection is not None:
+            await self._connection.close()
+
+RemoteChangeHandler = Callable[[Change], None]
+
+class ChangeFeed:
+    def __init__(self, broker: ChangeBroker):
+        self.broker = broker
+        self.origin = secrets.token_hex(4)
+        self.transport: ChangeTransport = LocalTransport()
+        self._remote_handlers: List[RemoteChangeHandler] = []
+
+    def on_remote_change(self, handler: RemoteChangeHandler) -> None:
+        """Call `handler` for changes published by other processes."""
+        self._remote_handlers.append(handler)
+
+    def _deliver(self, change: Change) -> None:
+        if change.origin != self.origin:
+            for handler in self._remote_handlers:
+                handler(change)
+        self.broker.dispatch(change)
+
+    async def start(self, transport: Optional[ChangeTransport] = None) -> None:
+        if transport is not None:
+            self.transport = transport
+        await self.transport.start(self._deliver)
+
+    async def stop(self) -> None:
+        await self.transport.stop()
+
+    async def publish(
+        self,
+        type: str,
+        event_id: Optional[int] = None,
+        event: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Publish a change after its transaction has committed; failures are logged, not raised."""
+        if event is not None:
+            # Same JSON types whichever transport carries it
+            event = orjson.loads(dumps(event))
+        try:
+            await self.transport.publish(type, event_id, event, self.origin)
+        except Exception:
+            logger.exception("Could not publish %s change for event %s", type, event_id)
+
+def create_transport(name: str) -> ChangeTransport:
+    """Build the transport named by CHANGE_FEED_TRANSPORT."""
+    if name == "local":
+        return LocalTransport()
+    if name == "postgres":
+        return PostgresTransport(engine, settings.DATABASE_URI, on_reconnect=change_feed.broker.clear_history)
+    raise ValueError(f"Unknown change feed transport {name!r}")
+
+change_feed = ChangeFeed(ChangeBroker(
+    queue_size=settings.CHANGE_FEED_QUEUE_SIZE,
+    history_size=settings.CHANGE_FEED_HISTORY
+))
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Event Management System"
@@ -13,10 +13,97 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = "5432"
     DATABASE_URI: Optional[str] = ""
     
+    # Database connection pool
+    DB_POOL_ENABLED: bool = True  # False falls back to NullPool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 2  # Connections each worker opens before accepting traffic
+    
+    # Read replicas: GET and HEAD requests read from these when set
+    DATABASE_REPLICA_URIS: List[str] = []
+    REPLICA_SELECTION: str = "round_robin"  # or "least_busy"
+    REPLICA_HEALTH_CHECK_SECONDS: float = 5.0
+    REPLICA_MAX_LAG_SECONDS: float = 0.0  # Eject Postgres replicas further behind; 0 disables
+    REPLICA_STICKY_SECONDS: float = 1.0  # Reads stay on the primary this long after a local write
+    
+    # SQL instrumentation (Server-Timing header, N+1 warnings)
+    SQL_INSTRUMENTATION_ENABLED: bool = True
+    SQL_REPEAT_THRESHOLD: int = 3  # Same statement this many times in one request is flagged
+    
+    # Metrics
+    METRICS_ENABLED: bool = True
+    METRICS_MULTIPROC_DIR: str = ""  # Shared directory for aggregating across workers
+    METRICS_FLUSH_SECONDS: float = 5.0
+    READINESS_TIMEOUT_SECONDS: float = 2.0
+    
     # Security
     SECRET_KEY: str = "your-secret-key-here"  # Change this in production
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
+    # Signing keys by kid, e.g. JWT_SIGNING_KEYS='{"2024-06": "...", "2024-01": "..."}'.
+    # Every key verifies; only JWT_ACTIVE_KID signs. Empty means SECRET_KEY alone
+    # (as kid "default"); once set, SECRET_KEY no longer verifies anything, so
+    # keep {"default": SECRET_KEY} in the map until its tokens have expired.
+    JWT_SIGNING_KEYS: Dict[str, str] = {}
+    JWT_ACTIVE_KID: str = ""
+    TOKEN_CACHE_MAX_SIZE: int = 10000  # Decoded tokens kept until they expire
+    REVOCATION_SYNC_SECONDS: float = 10.0  # How stale another worker's revocations may be
+    
+    # Authenticated user cache
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_BACKEND: str = ""  # "" for local only, "local" for the in-memory shared stand-in
+    
+    # Serialize hot endpoints straight to JSON with orjson, skipping
+    # response_model validation (the OpenAPI schema is unchanged)
+    FAST_JSON_RESPONSES: bool = False
+    
+    # Event response cache
+    EVENTS_CACHE_TTL_SECONDS: int = 30
+    EVENTS_CACHE_MAX_SIZE: int = 1024
+    EVENT_DETAIL_CACHE_TTL_SECONDS: int = 60
+    EVENT_DETAIL_CACHE_MAX_SIZE: int = 10000
+    
+    # Recurring events
+    RECURRENCE_MAX_COUNT: int = 10000  # Largest COUNT a rule may have
+    OCCURRENCE_WINDOW_MAX_DAYS: int = 366  # Widest window GET /events/occurrences expands
+    OCCURRENCE_CACHE_TTL_SECONDS: int = 300
+    OCCURRENCE_CACHE_MAX_SIZE: int = 10000  # Expanded (series, window) pairs
+    
+    # Bulk event import
+    BULK_IMPORT_CHUNK_SIZE: int = 1000
+    BULK_IMPORT_USE_COPY: bool = True  # Use COPY when running on asyncpg
+    BULK_IMPORT_MAX_ERRORS: int = 1000  # Row errors listed in the response
+    
+    # Batch updates and deletes
+    BATCH_MAX_OPERATIONS: int = 1000
+    
+    # Streaming export
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched from the server-side cursor at a time
+    
+    # Event change feed (Server-Sent Events)
+    CHANGE_FEED_TRANSPORT: str = "local"  # "postgres" (LISTEN/NOTIFY) is needed with several workers
+    CHANGE_FEED_QUEUE_SIZE: int = 100  # Undelivered changes before a slow subscriber is dropped
+    CHANGE_FEED_HISTORY: int = 1000  # Recent changes kept for clients resuming with Last-Event-ID
+    CHANGE_FEED_HEARTBEAT_SECONDS: float = 15.0
+    
+    # Password hashing executor
+    HASHER_WORKERS: int = 4
+    HASHER_MAX_QUEUE: int = 64  # Hashes allowed to wait before requests get a 503
+    HASHER_USE_PROCESSES: bool = False  # bcrypt releases the GIL, so threads are usually enough
+    
+    # Rate limiting: token buckets per client IP and per account (login
+    # username / signup email), as "capacity/seconds to refill completely"
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMITS: Dict[str, Dict[str, str]] = {
+        "POST /api/v1/auth/login": {"ip": "20/60", "account": "5/60"},
+        "POST /api/v1/auth/signup": {"ip": "5/60", "account": "3/3600"},
+    }
+    RATE_LIMIT_MAX_KEYS: int = 100000  # Buckets kept in memory per worker
+    RATE_LIMIT_BACKEND: str = ""  # "" for per-worker buckets, "local" for the in-memory shared stand-in
     
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000"]  # React's default port
@@ -24,6 +111,13 @@ class Settings(BaseSettings):
     # Server
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    SERVER_MODE: str = "development"  # "production" runs several workers under gunicorn
+    WEB_CONCURRENCY: int = 0  # Worker processes; 0 means one per available CPU
+    SERVER_LOOP: str = "auto"  # "uvloop", "asyncio" or "auto" (uvloop when installed)
+    SERVER_HTTP: str = "auto"  # "httptools", "h11" or "auto" (httptools when installed)
+    SERVER_PRELOAD: bool = True  # Import the app once before forking workers
+    GRACEFUL_TIMEOUT: int = 30  # Seconds in-flight requests get to finish on shutdown
+    KEEPALIVE_TIMEOUT: int = 5
     
     # Security Headers
     ALLOWED_HOSTS: List[str] = ["localhost", "127.0.0.1", "0.0.0.0"]
@@ -0,0 +1,113 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from passlib.context import CryptContext
+
+from .config import settings
+
+# Password hashing
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+class HashingBusyError(Exception):
+    """Raised when the hashing queue is full and a request should be shed."""
+
+# Module-level so they can be pickled into a process pool
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded worker pool so it never blocks the event loop.
+
+    At most ``max_workers`` hashes run at once and up to ``max_queue`` more
+    may wait; anything beyond that is rejected with HashingBusyError.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, use_processes: bool = False):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        if self.use_processes:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+
+    async def warmup(self) -> None:
+        """Start every worker and load the bcrypt backend ahead of the first request."""
+        self.start()
+        loop = asyncio.get_running_loop()
+        # Concurrent jobs make the pool spawn all of its threads or processes
+        await asyncio.gather(*(
+            loop.run_in_executor(self._executor, _hash, "warmup")
+            for _ in range(self.max_workers)
+        ))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs accepted but still waiting for a free worker."""
+        return max(self._pending - self.max_workers, 0)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise HashingBusyError("Password hashing queue is full")
+        self.start()
+        self._pending += 1
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+            elapsed = time.perf_counter() - start
+            self.completed += 1
+            self.latency_total += elapsed
+            if elapsed > self.latency_max:
+                self.latency_max = elapsed
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(_verify, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._pending,
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "latency_total": self.latency_total,
+            "latency_avg": self.latency_total / self.completed if self.completed else 0.0,
+            "latency_max": self.latency_max,
+        }
+
+password_hasher = PasswordHasher(
+    max_workers=settings.HASHER_WORKERS,
+    max_queue=settings.HASHER_MAX_QUEUE,
+    use_processes=settings.HASHER_USE_PROCESSES
+)
@@ -0,0 +1,147 @@
+import hashlib
+import secrets
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response, status
+
+from .cache import ReadThroughCache, TTLCache
+from .config import settings
+
+
+class TableVersion:
+    """
+    Change counter for a table, bumped by every write handler.
+
+    The counter is per process, so validators built from it embed a random
+    boot id to stay unique across restarts and workers.
+    """
+
+    def __init__(self) -> None:
+        self.boot_id = secrets.token_hex(4)
+        self.version = 0
+        self.last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+
+    def bump(self) -> None:
+        self.version += 1
+        self.last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    last_modified: datetime
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_body(cls, body: bytes, last_modified: Optional[datetime]) -> "CachedResponse":
+        """Build an entry whose strong ETag is derived from the body itself."""
+        if last_modified is None:
+            last_modified = datetime.now(timezone.utc)
+        elif last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return cls(
+            body=body,
+            etag=f'"{hashlib.sha1(body).hexdigest()[:16]}"',
+            last_modified=last_modified.astimezone(timezone.utc).replace(microsecond=0)
+        )
+
+    def _validator_headers(self) -> Dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+            "Cache-Control": "private, no-cache",
+        }
+
+    def is_fresh_for(self, request: Request) -> bool:
+        """Whether the client's conditional headers say it already has this body."""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or any(tag.removeprefix("W/") == self.etag for tag in tags)
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return since.tzinfo is not None and self.last_modified <= since
+        return False
+
+    def to_response(self, request: Request) -> Response:
+        if self.is_fresh_for(request):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers=self._validator_headers()
+            )
+        return Response(
+            content=self.body,
+            media_type="application/json",
+            headers={**self.headers, **self._validator_headers()}
+        )
+
+
+class ResponseCache:
+    """Serialized responses keyed by path and query string, tied to a TableVersion."""
+
+    def __init__(self, version: TableVersion, maxsize: int, ttl: float):
+        self.version = version
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def key_for(request: Request) -> str:
+        params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        return f"{request.url.path}?{params}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        return self._cache.get(key)
+
+    def store(
+        self,
+        key: str,
+        body: bytes,
+        seen_version: int,
+        headers: Optional[Dict[str, str]] = None
+    ) -> CachedResponse:
+        """
+        Cache a freshly rendered body.
+        
+        `seen_version` is the version read before querying; if a write landed
+        in the meantime the body may be stale, so it is returned uncached.
+        """
+        digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+        entry = CachedResponse(
+            body=body,
+            etag=f'"{self.version.boot_id}-{seen_version}-{digest}"',
+            last_modified=self.version.last_modified,
+            headers=headers or {}
+        )
+        if seen_version == self.version.version:
+            self._cache.set(key, entry)
+        return entry
+
+    def invalidate(self) -> None:
+        """Bump the table version and drop every cached response."""
+        self.version.bump()
+        self._cache.clear()
+
+    def stats(self):
+        return self._cache.stats()
+
+
+events_version = TableVersion()
+events_response_cache = ResponseCache(
+    events_version,
+    maxsize=settings.EVENTS_CACHE_MAX_SIZE,
+    ttl=settings.EVENTS_CACHE_TTL_SECONDS
+)
+
+# Rendered single-event responses keyed by event id
+event_detail_cache = ReadThroughCache(
+    maxsize=settings.EVENT_DETAIL_CACHE_MAX_SIZE,
+    ttl=settings.EVENT_DETAIL_CACHE_TTL_SECONDS
+)
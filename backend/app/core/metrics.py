@@ -0,0 +1,240 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+Collectors are plain dicts updated from the event loop, so recording a
+request costs a few dictionary operations and never takes a lock. With
+several workers each process periodically writes its counters to
+METRICS_MULTIPROC_DIR and /metrics merges every worker's file: counters
+and histograms are summed, gauges are reported per live worker (`pid`).
+"""
+import bisect
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Sample(NamedTuple):
+    family: str
+    kind: str  # "counter", "gauge" or "histogram"
+    name: str
+    labels: Tuple[Tuple[str, str], ...]
+    value: float
+
+def _labels(**labels: object) -> Tuple[Tuple[str, str], ...]:
+    return tuple((key, str(value)) for key, value in labels.items())
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = defaultdict(float)
+
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1.0) -> None:
+        self._values[labels] += amount
+
+    def samples(self) -> Iterable[Sample]:
+        for labels, value in self._values.items():
+            yield Sample(self.name, "counter", self.name, tuple(zip(self.labelnames, labels)), value)
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        state = self._values.get(labels)
+        if state is None:
+            state = self._values[labels] = [0.0] * (len(self.buckets) + 2)
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def samples(self) -> Iterable[Sample]:
+        for labels, state in self._values.items():
+            base = tuple(zip(self.labelnames, labels))
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield Sample(self.name, "histogram", f"{self.name}_bucket", base + (("le", le),), cumulative)
+            yield Sample(self.name, "histogram", f"{self.name}_sum", base, state[-1])
+            yield Sample(self.name, "histogram", f"{self.name}_count", base, cumulative)
+
+Collector = Callable[[], Iterable[Sample]]
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: List = []
+        self._collectors: List[Collector] = []
+        self.help: Dict[str, str] = {}
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help, labelnames)
+        self._metrics.append(metric)
+        self.help[name] = help
+        return metric
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), **kwargs) -> Histogram:
+        metric = Histogram(name, help, labelnames, **kwargs)
+        self._metrics.append(metric)
+        self.help[name] = help
+        return metric
+
+    def register_collector(self, collector: Collector, help: Optional[Dict[str, str]] = None) -> None:
+        """Add a callback producing samples (typically gauges) at scrape time."""
+        self._collectors.append(collector)
+        self.help.update(help or {})
+
+    def collect(self) -> List[Sample]:
+        samples: List[Sample] = []
+        for metric in self._metrics:
+            samples.extend(metric.samples())
+        for collector in self._collectors:
+            samples.extend(collector())
+        return samples
+
+def gauge(name: str, value: float, **labels: object) -> Sample:
+    return Sample(name, "gauge", name, _labels(**labels), float(value))
+
+def counter_sample(name: str, value: float, **labels: object) -> Sample:
+    return Sample(name, "counter", name, _labels(**labels), float(value))
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    # Full precision, as the Prometheus client writes it; "%g" would stall
+    # large counters at 6 significant digits
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+def render(samples: Iterable[Sample], help: Dict[str, str]) -> str:
+    """Format samples in the Prometheus text exposition format."""
+    families: Dict[str, List[Sample]] = defaultdict(list)
+    for sample in samples:
+        families[sample.family].append(sample)
+
+    lines = []
+    for family, family_samples in sorted(families.items()):
+        lines.append(f"# HELP {family} {help.get(family, family)}")
+        lines.append(f"# TYPE {family} {family_samples[0].kind}")
+        for sample in family_samples:
+            if sample.labels:
+                labels = ",".join(f'{key}="{_escape(value)}"' for key, value in sample.labels)
+                lines.append(f"{sample.name}{{{labels}}} {_format_value(sample.value)}")
+            else:
+                lines.append(f"{sample.name} {_format_value(sample.value)}")
+    return "\n".join(lines) + "\n"
+
+# Multi-process aggregation
+
+def write_snapshot(directory: str, samples: Iterable[Sample]) -> None:
+    """Atomically write this worker's samples to `directory`."""
+    path = os.path.join(directory, f"worker-{os.getpid()}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"pid": os.getpid(), "written_at": time.time(), "samples": list(samples)}, f)
+    os.replace(tmp_path, path)
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def merge_snapshots(directory: str) -> List[Sample]:
+    """
+    Combine every worker's snapshot.
+
+    Counters and histograms from exited workers are kept so totals never go
+    backwards; their gauges are dropped.
+    """
+    totals: Dict[Tuple[str, str, str, Tuple], float] = defaultdict(float)
+    gauges: List[Sample] = []
+    for filename in os.listdir(directory):
+        if not (filename.startswith("worker-") and filename.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(directory, filename)) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            continue
+        alive = _pid_alive(snapshot["pid"])
+        for family, kind, name, labels, value in snapshot["samples"]:
+            labels = tuple(tuple(pair) for pair in labels)
+            if kind == "gauge":
+                if alive:
+                    gauges.append(Sample(family, kind, name, labels + (("pid", str(snapshot["pid"])),), value))
+            else:
+                totals[(family, kind, name, labels)] += value
+    return [Sample(*key, value) for key, value in totals.items()] + gauges
+
+class MetricsMiddleware:
+    """Record per-route request latency and status codes."""
+
+    def __init__(self, app: ASGIApp, requests: Counter, latency: Histogram):
+        self.app = app
+        self.requests = requests
+        self.latency = latency
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the scope; use its
+            # template so path parameters don't explode label cardinality
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            self.latency.observe((method, path), time.perf_counter() - start)
+            self.requests.inc((method, path, str(status_code)))
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code",
+    ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template",
+    ("method", "route")
+)
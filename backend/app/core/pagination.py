@@ -0,0 +1,24 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(date: datetime, id: int) -> str:
+    """Build an opaque cursor pointing just past the (date, id) key."""
+    raw = json.dumps([date.isoformat(), id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Turn a cursor from encode_cursor back into its (date, id) key."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date_str, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(date_str), int(id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
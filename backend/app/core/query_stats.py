@@ -0,0 +1,145 @@
+import json
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("app.sql")
+
+@dataclass
+class QueryStats:
+    """SQL statements executed within one scope (usually a request)."""
+    parent: Optional["QueryStats"] = None
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += elapsed
+            stats.statements[statement] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        """Statements run at least `threshold` times, a typical N+1 signature."""
+        return {sql: n for sql, n in self.statements.items() if n >= threshold}
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every statement on `engine` and attribute it to the active QueryStats."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _on_error(exception_context):
+        starts = exception_context.connection.info.get("query_start_time") if exception_context.connection else None
+        if starts:
+            starts.pop()
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """
+    Assert that at most `max_queries` statements run inside the block.
+
+    Meant for tests, e.g. pinning an endpoint's budget:
+
+        with query_budget(2):
+            await client.get("/api/v1/events/", headers=auth)
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+    if stats.count > max_queries:
+        listing = "\n".join(f"  {n}x {sql}" for sql, n in stats.statements.most_common())
+        raise QueryBudgetExceeded(
+            f"Expected at most {max_queries} queries, got {stats.count}:\n{listing}"
+        )
+
+class QueryStatsMiddleware:
+    """
+    Count and time SQL per request.
+
+    Totals go out as a `Server-Timing` header and a structured log line;
+    statements repeated `repeat_threshold` or more times are logged as a
+    likely N+1 pattern.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 3):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(parent=_current_stats.get())
+        token = _current_stats.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - start) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", '
+                    f"app;dur={total_ms:.2f}"
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            self._log(scope, status_code, stats, time.perf_counter() - start)
+
+    def _log(self, scope: Scope, status_code: int, stats: QueryStats, elapsed: float) -> None:
+        repeated = stats.repeated(self.repeat_threshold)
+        level = logging.WARNING if repeated else logging.DEBUG
+        if not logger.isEnabledFor(level):
+            return
+        record: Dict[str, Any] = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "queries": stats.count,
+            "db_ms": round(stats.duration * 1000, 2),
+            "total_ms": round(elapsed * 1000, 2),
+        }
+        if repeated:
+            record["repeated_statements"] = repeated
+        logger.log(level, json.dumps(record))
@@ -0,0 +1,332 @@
+"""
+Token-bucket rate limiting for expensive routes, applied in front of the app.
+
+Each configured route has buckets keyed by client IP and, optionally, by
+the account a request names (the `username` of a login form, the `email`
+of a signup). A request takes a token from each before the route runs;
+when one is empty the middleware answers 429 with Retry-After itself, so
+the route's password hashing and queries never run, and the tokens already
+taken are given back. Once the route has answered 2xx or 3xx the account
+token is given back too, so failed guesses at an account lock it for a
+while but its owner's successful logins don't count against it.
+
+The client IP is the ASGI client address, i.e. whatever the server made of
+proxy headers (uvicorn/gunicorn --forwarded-allow-ips).
+"""
+import json
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import Counter, registry
+from .serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# Request fields naming the account, for the "account" buckets
+ACCOUNT_FIELDS = ("username", "email")
+
+# Larger bodies aren't parsed for an account; the IP bucket still applies
+MAX_BODY_SIZE = 64 * 1024
+
+@dataclass(frozen=True)
+class Rate:
+    """A bucket of `capacity` tokens that refills completely in `period` seconds."""
+    capacity: float
+    period: float
+
+    @property
+    def per_second(self) -> float:
+        return self.capacity / self.period
+
+    @classmethod
+    def parse(cls, value: str) -> "Rate":
+        """Parse "capacity/period", e.g. "5/60" for five requests a minute."""
+        capacity, _, period = value.partition("/")
+        rate = cls(float(capacity), float(period or 1))
+        if rate.capacity < 1 or rate.period <= 0:
+            raise ValueError(f"Invalid rate: {value!r}")
+        return rate
+
+class TokenBuckets:
+    """
+    Token buckets in one OrderedDict of (tokens, last update, full at)
+    tuples, least recently used first.
+
+    A bucket that has refilled completely is no different from a new one,
+    so it expires then: the window slides forward with every request, and
+    each call drops the expired buckets at the old end. `maxsize` bounds
+    memory under a flood of distinct keys by evicting the least recently
+    used bucket.
+
+    Not thread-safe; it is meant to be used from the event loop only.
+    """
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float, float]]" = OrderedDict()
+
+    def take(self, key: str, rate: Rate, cost: float = 1.0) -> float:
+        """Take `cost` tokens; returns 0 if they were there, else the seconds until they will be."""
+        now = self.clock()
+        self._expire(now)
+
+        entry = self._buckets.pop(key, None)
+        tokens = self._tokens(entry, rate, now)
+        if tokens >= cost:
+            tokens -= cost
+            wait = 0.0
+        else:
+            wait = (cost - tokens) / rate.per_second
+
+        self._buckets[key] = (tokens, now, now + (rate.capacity - tokens) / rate.per_second)
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def refund(self, key: str, rate: Rate, cost: float = 1.0) -> None:
+        """Give back `cost` tokens taken earlier."""
+        now = self.clock()
+        entry = self._buckets.get(key)
+        if entry is None:
+            # Expired or evicted, i.e. full anyway
+            return
+        tokens = min(rate.capacity, self._tokens(entry, rate, now) + cost)
+        self._buckets[key] = (tokens, now, now + (rate.capacity - tokens) / rate.per_second)
+
+    @staticmethod
+    def _tokens(entry: Optional[Tuple[float, float, float]], rate: Rate, now: float) -> float:
+        if entry is None:
+            return rate.capacity
+        return min(rate.capacity, entry[0] + (now - entry[1]) * rate.per_second)
+
+    def _expire(self, now: float) -> None:
+        while self._buckets:
+            key, (_, _, full_at) = next(iter(self._buckets.items()))
+            if full_at > now:
+                break
+            del self._buckets[key]
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+class RateLimitBackend(ABC):
+    """Token buckets shared by every worker, so a limit holds across processes."""
+
+    @abstractmethod
+    async def take(self, key: str, rate: Rate) -> float:
+        """Take a token from `key`'s bucket; 0 if there was one, else seconds until there is."""
+
+    @abstractmethod
+    async def refund(self, key: str, rate: Rate) -> None:
+        """Give back a token taken earlier."""
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """
+    In-memory stand-in for a shared store such as Redis, which would run the
+    same refill-and-take atomically (e.g. in a Lua script) on its own clock.
+    """
+
+    def __init__(self, maxsize: int = 100_000):
+        self._buckets = TokenBuckets(maxsize, clock=time.time)
+
+    async def take(self, key: str, rate: Rate) -> float:
+        return self._buckets.take(key, rate)
+
+    async def refund(self, key: str, rate: Rate) -> None:
+        self._buckets.refund(key, rate)
+
+def create_rate_limit_backend(name: str) -> Optional[RateLimitBackend]:
+    """Build the shared rate limit backend configured by name, if any."""
+    if not name:
+        return None
+    if name == "local":
+        return LocalRateLimitBackend()
+    raise ValueError(f"Unknown rate limit backend: {name}")
+
+RouteRules = Dict[Tuple[str, str], Dict[str, Rate]]
+
+def parse_rate_limits(config: Mapping[str, Mapping[str, str]]) -> RouteRules:
+    """
+    Turn RATE_LIMITS ({"POST /path": {"ip": "20/60", "account": "5/60"}})
+    into rates by (method, path).
+    """
+    rules: RouteRules = {}
+    for route, buckets in config.items():
+        method, _, path = route.partition(" ")
+        unknown = set(buckets) - {"ip", "account"}
+        if not path or unknown:
+            raise ValueError(f"Invalid rate limit for {route!r}")
+        rules[(method.upper(), path.rstrip("/"))] = {
+            kind: Rate.parse(value) for kind, value in buckets.items()
+        }
+    return rules
+
+def account_from_body(body: bytes, content_type: str) -> Optional[str]:
+    """The account a login or signup body names, normalized; None if there isn't one."""
+    try:
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            fields = {key: values[0] for key, values in parse_qs(body.decode()).items()}
+        elif content_type.startswith("application/json"):
+            fields = json.loads(body)
+        else:
+            return None
+    except ValueError:
+        return None
+    if not isinstance(fields, dict):
+        return None
+    for name in ACCOUNT_FIELDS:
+        value = fields.get(name)
+        if isinstance(value, str) and value.strip():
+            return value.strip().lower()
+    return None
+
+rate_limited_requests_total = registry.counter(
+    "rate_limited_requests_total",
+    "Requests refused with 429 by route and bucket kind",
+    ("route", "bucket")
+)
+
+class RateLimitMiddleware:
+    """
+    Refuse requests to the routes in `rules` once one of their buckets is
+    empty. With a shared `backend`, buckets that still have tokens locally
+    are checked there too; one this worker has emptied already is refused
+    without asking, since the shared bucket has seen at least as much.
+    Account tokens are given back after 2xx and 3xx responses.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: RouteRules,
+        buckets: TokenBuckets,
+        backend: Optional[RateLimitBackend] = None,
+        rejected: Optional[Counter] = None
+    ):
+        self.app = app
+        self.rules = rules
+        self.buckets = buckets
+        self.backend = backend
+        self.rejected = rejected
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        route = (scope["method"], scope["path"].rstrip("/"))
+        rates = self.rules.get(route)
+        if rates is None:
+            await self.app(scope, receive, send)
+            return
+
+        path = route[1]
+        keys: List[Tuple[str, str, Rate]] = []
+        if "ip" in rates:
+            client = scope.get("client")
+            keys.append(("ip", f"{path}:ip:{client[0] if client else 'unknown'}", rates["ip"]))
+        if "account" in rates:
+            messages, body = await self._read_body(receive)
+            receive = self._replay(messages, receive)
+            headers = dict(scope["headers"])
+            account = None
+            if body is not None:
+                account = account_from_body(body, headers.get(b"content-type", b"").decode("latin-1"))
+            if account is not None:
+                keys.append(("account", f"{path}:account:{account}", rates["account"]))
+
+        # Charge every bucket before the route runs, so concurrent requests
+        # can't all get in before the first of them is counted
+        taken: List[Tuple[str, str, Rate]] = []
+        for kind, key, rate in keys:
+            wait = await self._take(key, rate)
+            if wait:
+                # A refused request costs nothing
+                for _, taken_key, taken_rate in taken:
+                    await self._refund(taken_key, taken_rate)
+                await self._reject(scope, send, kind, wait)
+                return
+            taken.append((kind, key, rate))
+
+        status = None
+
+        async def send_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_status)
+        if status is not None and status < 400:
+            for kind, key, rate in keys:
+                if kind == "account":
+                    await self._refund(key, rate)
+
+    async def _take(self, key: str, rate: Rate) -> float:
+        wait = self.buckets.take(key, rate)
+        if wait or self.backend is None:
+            return wait
+        wait = await self.backend.take(key, rate)
+        if wait:
+            self.buckets.refund(key, rate)
+        return wait
+
+    async def _refund(self, key: str, rate: Rate) -> None:
+        self.buckets.refund(key, rate)
+        if self.backend is not None:
+            await self.backend.refund(key, rate)
+
+    async def _read_body(self, receive: Receive) -> Tuple[List[Message], Optional[bytes]]:
+        """Read the request body for inspection, up to MAX_BODY_SIZE (None beyond that)."""
+        messages: List[Message] = []
+        size = 0
+        while True:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                return messages, None
+            size += len(message.get("body", b""))
+            if size > MAX_BODY_SIZE:
+                return messages, None
+            if not message.get("more_body", False):
+                return messages, b"".join(m.get("body", b"") for m in messages)
+
+    @staticmethod
+    def _replay(messages: List[Message], receive: Receive) -> Receive:
+        """A receive() that hands the app the messages read so far, then the rest."""
+        pending = list(messages)
+
+        async def replay() -> Message:
+            if pending:
+                return pending.pop(0)
+            return await receive()
+
+        return replay
+
+    async def _reject(self, scope: Scope, send: Send, kind: str, wait: float) -> None:
+        path = scope["path"].rstrip("/")
+        if self.rejected is not None:
+            self.rejected.inc((path, kind))
+        logger.info("Rate limited %s %s by %s bucket", scope["method"], path, kind)
+        body = dumps({"detail": "Too many requests"})
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(wait))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,261 @@
+"""
+Recurrence rules for repeating events and lazy expansion of their occurrences.
+
+Rules use the RRULE subset a calendar UI needs: FREQ (DAILY, WEEKLY,
+MONTHLY, YEARLY), INTERVAL, COUNT, UNTIL, BYDAY (weekly) and BYMONTHDAY
+(monthly), e.g. "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;COUNT=10".
+
+Expansion never walks the series from its start: the first period that can
+reach the window is computed arithmetically, so expanding a window costs
+in proportion to the occurrences inside it, however long the series is.
+Occurrences keep the wall-clock time of the first one in UTC.
+"""
+import calendar
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import count, islice
+from typing import Hashable, Iterator, Optional, Tuple
+
+from .cache import TTLCache
+from .config import settings
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+class InvalidRecurrenceRule(ValueError):
+    pass
+
+def as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (e.g. from SQLite) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def _parse_until(value: str) -> datetime:
+    for fmt in ("%Y%m%dT%H%M%SZ", "%Y%m%dT%H%M%S", "%Y%m%d"):
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        if fmt == "%Y%m%d":
+            # A date-only UNTIL includes that whole day
+            parsed = parsed.replace(hour=23, minute=59, second=59)
+        return parsed.replace(tzinfo=timezone.utc)
+    raise InvalidRecurrenceRule(f"UNTIL must look like 20261231T235959Z, got {value!r}")
+
+def _positive_int(name: str, value: str) -> int:
+    if not value.isdigit() or int(value) < 1:
+        raise InvalidRecurrenceRule(f"{name} must be a positive integer")
+    return int(value)
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    freq: str
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+    by_day: Tuple[int, ...] = ()  # Weekday numbers, Monday is 0
+    by_month_day: Tuple[int, ...] = ()  # 1..31, or -1 for the last day and so on
+
+    @classmethod
+    def parse(cls, value: str) -> "RecurrenceRule":
+        """Parse "FREQ=...;..." (an "RRULE:" prefix is allowed)."""
+        value = value.strip()
+        if value.upper().startswith("RRULE:"):
+            value = value[6:]
+        parts = {}
+        for part in filter(None, value.split(";")):
+            name, sep, part_value = part.partition("=")
+            if not sep:
+                raise InvalidRecurrenceRule(f"Expected NAME=VALUE, got {part!r}")
+            parts[name.strip().upper()] = part_value.strip().upper()
+
+        freq = parts.pop("FREQ", None)
+        if freq not in FREQUENCIES:
+            raise InvalidRecurrenceRule(f"FREQ must be one of {', '.join(FREQUENCIES)}")
+        interval = _positive_int("INTERVAL", parts.pop("INTERVAL", "1"))
+        count_value = parts.pop("COUNT", None)
+        until_value = parts.pop("UNTIL", None)
+        if count_value is not None and until_value is not None:
+            raise InvalidRecurrenceRule("COUNT and UNTIL cannot both be set")
+        rule_count = _positive_int("COUNT", count_value) if count_value is not None else None
+        if rule_count is not None and rule_count > settings.RECURRENCE_MAX_COUNT:
+            raise InvalidRecurrenceRule(f"COUNT may be at most {settings.RECURRENCE_MAX_COUNT}")
+        until = _parse_until(until_value) if until_value is not None else None
+
+        by_day: Tuple[int, ...] = ()
+        if "BYDAY" in parts:
+            if freq != "WEEKLY":
+                raise InvalidRecurrenceRule("BYDAY is only supported with FREQ=WEEKLY")
+            days = parts.pop("BYDAY").split(",")
+            if not all(day in WEEKDAYS for day in days):
+                raise InvalidRecurrenceRule(f"BYDAY values must be among {','.join(WEEKDAYS)}")
+            by_day = tuple(sorted({WEEKDAYS.index(day) for day in days}))
+
+        by_month_day: Tuple[int, ...] = ()
+        if "BYMONTHDAY" in parts:
+            if freq != "MONTHLY":
+                raise InvalidRecurrenceRule("BYMONTHDAY is only supported with FREQ=MONTHLY")
+            try:
+                days = {int(day) for day in parts.pop("BYMONTHDAY").split(",")}
+            except ValueError:
+                raise InvalidRecurrenceRule("BYMONTHDAY values must be integers")
+            if not all(1 <= abs(day) <= 31 for day in days):
+                raise InvalidRecurrenceRule("BYMONTHDAY values must be between 1 and 31 (or -31 and -1)")
+            by_month_day = tuple(sorted(days))
+
+        if parts:
+            raise InvalidRecurrenceRule(f"Unsupported rule parts: {', '.join(sorted(parts))}")
+        return cls(freq, interval, rule_count, until, by_day, by_month_day)
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.by_day:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.by_day))
+        if self.by_month_day:
+            parts.append("BYMONTHDAY=" + ",".join(str(day) for day in self.by_month_day))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until.strftime('%Y%m%dT%H%M%SZ')}")
+        return ";".join(parts)
+
+def _months(value: datetime) -> int:
+    return value.year * 12 + value.month - 1
+
+def _periods(rule: RecurrenceRule, dtstart: datetime, start: datetime) -> Iterator[Tuple[datetime, Iterator[datetime]]]:
+    """
+    Yield (period start, candidate occurrences) from the first period that
+    can contain `start`. Candidates are ascending, may fall before dtstart
+    and are skipped when the date does not exist (e.g. February 30th).
+    """
+    if rule.freq == "DAILY":
+        step = timedelta(days=rule.interval)
+        first = max(0, (start - dtstart) // step)
+        for k in count(first):
+            occurrence = dtstart + k * step
+            yield occurrence, iter((occurrence,))
+
+    elif rule.freq == "WEEKLY":
+        step = timedelta(weeks=rule.interval)
+        week = dtstart - timedelta(days=dtstart.weekday())
+        days = rule.by_day or (dtstart.weekday(),)
+        first = max(0, (start - week) // step)
+        for k in count(first):
+            period = week + k * step
+            yield period, (period + timedelta(days=day) for day in days)
+
+    elif rule.freq == "MONTHLY":
+        days = rule.by_month_day or (dtstart.day,)
+        first = max(0, (_months(start) - _months(dtstart)) // rule.interval)
+
+        def month_candidates(year: int, month: int) -> Iterator[datetime]:
+            length = calendar.monthrange(year, month)[1]
+            resolved = sorted({day if day > 0 else length + day + 1 for day in days})
+            for day in resolved:
+                if 1 <= day <= length:
+                    yield dtstart.replace(year=year, month=month, day=day)
+
+        for k in count(first):
+            year, month = divmod(_months(dtstart) + k * rule.interval, 12)
+            month += 1
+            yield dtstart.replace(year=year, month=month, day=1), month_candidates(year, month)
+
+    else:  # YEARLY
+        first = max(0, (start.year - dtstart.year) // rule.interval)
+
+        def year_candidates(year: int) -> Iterator[datetime]:
+            if dtstart.month == 2 and dtstart.day == 29 and not calendar.isleap(year):
+                return
+            yield dtstart.replace(year=year)
+
+        for k in count(first):
+            year = dtstart.year + k * rule.interval
+            yield dtstart.replace(year=year, month=1, day=1), year_candidates(year)
+
+def occurrences(
+    rule: RecurrenceRule,
+    dtstart: datetime,
+    start: datetime,
+    end: datetime,
+    until: Optional[datetime] = None
+) -> Iterator[datetime]:
+    """
+    Lazily yield the occurrence starts within [start, end].
+
+    `until` bounds the series; pass series_end() for COUNT rules, whose
+    last occurrence cannot be found without counting from the start.
+    """
+    dtstart, start, end = as_utc(dtstart), as_utc(start), as_utc(end)
+    limit = min(end, as_utc(until)) if until is not None else end
+    if rule.until is not None:
+        limit = min(limit, rule.until)
+    periods = _periods(rule, dtstart, max(start, dtstart))
+    while True:
+        try:
+            period, candidates = next(periods)
+        except (OverflowError, ValueError):
+            # Ran past datetime.max looking for a date that never exists
+            return
+        if period > limit:
+            return
+        for occurrence in candidates:
+            if occurrence > limit:
+                return
+            if occurrence >= start and occurrence >= dtstart:
+                yield occurrence
+
+def series_end(rule: RecurrenceRule, dtstart: datetime) -> Optional[datetime]:
+    """Start of the last occurrence, or None for a series without end."""
+    dtstart = as_utc(dtstart)
+    if rule.count is not None:
+        # COUNT is capped at RECURRENCE_MAX_COUNT, so this walk is bounded
+        unbounded = RecurrenceRule(rule.freq, rule.interval, None, None, rule.by_day, rule.by_month_day)
+        last = None
+        for last in islice(occurrences(unbounded, dtstart, dtstart, datetime.max.replace(tzinfo=timezone.utc)), rule.count):
+            pass
+        return last
+    if rule.until is not None:
+        return max(rule.until, dtstart)
+    return None
+
+class OccurrenceCache:
+    """
+    Expanded windows keyed by everything that determines them (rule, first
+    start, series end and window), so a changed series simply misses and
+    nothing needs invalidating.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def expand(
+        self,
+        rule: str,
+        dtstart: datetime,
+        until: Optional[datetime],
+        start: datetime,
+        end: datetime
+    ) -> Tuple[datetime, ...]:
+        key: Hashable = (rule, as_utc(dtstart), until and as_utc(until), as_utc(start), as_utc(end))
+        expanded = self._cache.get(key)
+        if expanded is None:
+            expanded = tuple(occurrences(RecurrenceRule.parse(rule), dtstart, start, end, until))
+            self._cache.set(key, expanded)
+        return expanded
+
+    def stats(self):
+        return self._cache.stats()
+
+occurrence_cache = OccurrenceCache(
+    maxsize=settings.OCCURRENCE_CACHE_MAX_SIZE,
+    ttl=settings.OCCURRENCE_CACHE_TTL_SECONDS
+)
+
+def recurrence_until(rule: Optional[str], dtstart: datetime) -> Optional[datetime]:
+    """Value for Event.recurrence_until: the series end, or None for one-off and open-ended events."""
+    if not rule:
+        return None
+    return series_end(RecurrenceRule.parse(rule), dtstart)
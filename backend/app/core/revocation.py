@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Mapping, Optional
+
+from sqlalchemy import delete, event, insert, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .config import settings
+from ..models.token_revocation import TokenRevocation
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+def _timestamp(value: datetime) -> float:
+    # SQLite hands back naive datetimes; everything is stored in UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+class RevocationList:
+    """
+    In-memory copy of the token_revocations table.
+
+    Lookups are dict probes, so checking a token never touches the database.
+    The copy is refreshed from the table every few seconds, which is how
+    revocations made on other workers arrive; revocations made on this
+    worker apply immediately. Entries are dropped once the tokens they
+    cover have expired, so memory stays proportional to the revocations
+    still in force.
+    """
+
+    def __init__(self) -> None:
+        self._jtis: Dict[str, float] = {}  # jti -> token expiry
+        self._user_cutoffs: Dict[int, tuple] = {}  # user id -> (revoked at, expiry)
+        self.last_sync: Optional[float] = None
+        self.syncs = 0
+        self.sync_failures = 0
+
+    def is_revoked(self, claims: Mapping[str, Any]) -> bool:
+        jti = claims.get("jti")
+        if jti is not None and jti in self._jtis:
+            return True
+        cutoff = self._user_cutoffs.get(int(claims["sub"]))
+        if cutoff is not None:
+            # Both carry microseconds, so logging straight back in works
+            # while a token minted just before the revocation doesn't. An
+            # older whole-second `iat` rounds down, so errs towards revoked;
+            # tokens without `iat` predate revocation support and are
+            # covered too.
+            return claims.get("iat", 0) < cutoff[0]
+        return False
+
+    def revoke_token(self, jti: str, expires_at: float) -> None:
+        self._jtis[jti] = expires_at
+
+    def revoke_user(self, user_id: int, revoked_at: float, expires_at: float) -> None:
+        current = self._user_cutoffs.get(user_id)
+        if current is None or current[0] < revoked_at:
+            self._user_cutoffs[user_id] = (revoked_at, expires_at)
+
+    def prune(self, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        self._jtis = {jti: exp for jti, exp in self._jtis.items() if exp > now}
+        self._user_cutoffs = {
+            user_id: cutoff for user_id, cutoff in self._user_cutoffs.items() if cutoff[1] > now
+        }
+
+    async def record(
+        self,
+        session: AsyncSession,
+        *,
+        expires_at: datetime,
+        jti: Optional[str] = None,
+        user_id: Optional[int] = None
+    ) -> None:
+        """Persist a revocation and apply it to this worker straight away."""
+        revoked_at = datetime.now(timezone.utc)
+        session.add(TokenRevocation(
+            jti=jti, user_id=user_id, revoked_at=revoked_at, expires_at=expires_at
+        ))
+        try:
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            # Only an already revoked jti is expected; anything else, such as
+            # an unknown user_id, is a real error and must not apply locally
+            if jti is None or await session.scalar(
+                select(TokenRevocation.id).where(TokenRevocation.jti == jti)
+            ) is None:
+                raise
+        if jti is not None:
+            self.revoke_token(jti, expires_at.timestamp())
+        else:
+            self.revoke_user(user_id, revoked_at.timestamp(), expires_at.timestamp())
+
+    async def sync(self, session: AsyncSession) -> None:
+        """Merge the table's unexpired rows into memory and purge expired ones everywhere."""
+        now = datetime.now(timezone.utc)
+        await session.execute(delete(TokenRevocation).where(TokenRevocation.expires_at <= now))
+        result = await session.execute(
+            select(
+                TokenRevocation.jti,
+                TokenRevocation.user_id,
+                TokenRevocation.revoked_at,
+                TokenRevocation.expires_at
+            ).where(TokenRevocation.expires_at > now)
+        )
+        rows = result.all()
+        await session.commit()
+
+        # Revocations are never undone, so local entries are kept even if
+        # the snapshot missed them (e.g. committed just after the SELECT).
+        # Whole dicts are swapped in so lookups never see a half-built copy.
+        timestamp = now.timestamp()
+        jtis = {jti: exp for jti, exp in self._jtis.items() if exp > timestamp}
+        user_cutoffs = {
+            user_id: cutoff for user_id, cutoff in self._user_cutoffs.items() if cutoff[1] > timestamp
+        }
+        for jti, user_id, revoked_at, expires_at in rows:
+            if jti is not None:
+                jtis[jti] = _timestamp(expires_at)
+            elif user_id is not None:
+                cutoff = (_timestamp(revoked_at), _timestamp(expires_at))
+                if user_id not in user_cutoffs or user_cutoffs[user_id][0] < cutoff[0]:
+                    user_cutoffs[user_id] = cutoff
+
+        self._jtis = jtis
+        self._user_cutoffs = user_cutoffs
+        self.last_sync = time.time()
+        self.syncs += 1
+
+    async def sync_periodically(self, session_factory, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with session_factory() as session:
+                    await self.sync(session)
+            except Exception:
+                self.sync_failures += 1
+                self.prune()
+                logger.exception("Could not sync token revocations")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tokens": len(self._jtis),
+            "users": len(self._user_cutoffs),
+            "syncs": self.syncs,
+            "sync_failures": self.sync_failures,
+            "last_sync": self.last_sync,
+        }
+
+revocation_list = RevocationList()
+
+# User fields that access tokens carry as claims (see create_access_token)
+CLAIMED_USER_FIELDS = ("role", "is_active")
+
+def _user_revocation(user_id: int) -> Dict[str, Any]:
+    revoked_at = datetime.now(timezone.utc)
+    # Long enough to outlive any token the revocation could apply to
+    expires_at = revoked_at + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return {"user_id": user_id, "revoked_at": revoked_at, "expires_at": expires_at}
+
+def _revoke_on_commit(session: Session, values: Dict[str, Any]) -> None:
+    session.info.setdefault("revoked_users", []).append(values)
+
+def revoke_user_on_commit(session: Session, user_id: int) -> None:
+    """
+    Revoke every token issued to `user_id` so far in `session`'s transaction,
+    applying it to this worker once that commits; for writes the ORM events
+    don't see.
+    """
+    values = _user_revocation(user_id)
+    session.add(TokenRevocation(**values))
+    _revoke_on_commit(session, values)
+
+# A role change or deactivation revokes the user's tokens, whose claims
+# would otherwise keep authorizing with the old values until they expire
+@event.listens_for(User, "after_update")
+def _on_user_updated(mapper, connection: Connection, target: User) -> None:
+    state = inspect(target)
+    if not any(state.attrs[name].history.has_changes() for name in CLAIMED_USER_FIELDS):
+        return
+    values = _user_revocation(target.id)
+    connection.execute(insert(TokenRevocation).values(**values))
+    _revoke_on_commit(state.session, values)
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    for values in session.info.pop("revoked_users", ()):
+        revocation_list.revoke_user(
+            values["user_id"], values["revoked_at"].timestamp(), values["expires_at"].timestamp()
+        )
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session: Session) -> None:
+    session.info.pop("revoked_users", None)
@@ -1,21 +1,23 @@
+import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Any, Dict, Union
 
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
 from ..core.config import settings
+from ..core.hashing import pwd_context, password_hasher, HashingBusyError
+from ..core.revocation import revocation_list
+from ..core.tokens import token_verifier
+from ..core.user_cache import get_cached_user, cache_user
 from ..db.base import get_db
-from ..models.user import User, UserRole
+from ..db.repository import users
+from ..models.user import UserRole
 from ..schemas.user import UserInDB
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 security = HTTPBearer()
@@ -28,22 +30,73 @@ def get_password_hash(password: str) -> str:
     """Generate a password hash."""
     return pwd_context.hash(password)
 
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server is busy, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing executor."""
+    try:
+        return await password_hasher.verify(plain_password, hashed_password)
+    except HashingBusyError:
+        raise _hashing_busy()
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate a password hash on the hashing executor."""
+    try:
+        return await password_hasher.hash(password)
+    except HashingBusyError:
+        raise _hashing_busy()
+
 def create_access_token(
-    subject: Union[str, Any], expires_delta: Optional[timedelta] = None
+    subject: Union[str, Any],
+    expires_delta: Optional[timedelta] = None,
+    role: Optional[UserRole] = None,
+    is_active: Optional[bool] = None
 ) -> str:
-    """Create a JWT access token."""
+    """Create a JWT access token, optionally carrying role and active claims."""
+    now = datetime.now(timezone.utc)
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
+        expire = now + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
     
-    to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+    # `jti` and `iat` let a single token or all of a user's tokens be revoked;
+    # `iat` keeps its microseconds so a revocation covers exactly the tokens
+    # issued before it, even within the same second
+    to_encode = {"exp": expire, "iat": now.timestamp(), "jti": uuid.uuid4().hex, "sub": str(subject)}
+    if role is not None:
+        to_encode["role"] = UserRole(role).value
+    if is_active is not None:
+        to_encode["active"] = is_active
+    return token_verifier.encode(to_encode)
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
     )
-    return encoded_jwt
+
+def _decode_token(credentials: HTTPAuthorizationCredentials) -> Dict[str, Any]:
+    try:
+        payload = token_verifier.decode(credentials.credentials)
+    except JWTError:
+        raise _credentials_exception()
+    if payload.get("sub") is None or revocation_list.is_revoked(payload):
+        raise _credentials_exception()
+    return payload
+
+async def get_token_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> Dict[str, Any]:
+    """The verified, unrevoked claims of the request's bearer token."""
+    return _decode_token(credentials)
 
 async def get_current_user(
     request: Request,
@@ -51,33 +104,24 @@ async def get_current_user(
     db: AsyncSession = Depends(get_db)
 ) -> UserInDB:
     """Get the current user from the JWT token."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    # Get user from database
-    result = await db.execute(select(User).filter(User.id == int(user_id)))
-    user = result.scalars().first()
-    
+    user_id = _decode_token(credentials)["sub"]
+    return await _load_user(request, int(user_id), db)
+
+async def _load_user(request: Request, user_id: int, db: AsyncSession) -> UserInDB:
+    # Serve from the user cache when possible, falling back to the database
+    user = await get_cached_user(user_id)
     if user is None:
-        raise credentials_exception
+        db_user = await users.get(db, user_id)
+        
+        if db_user is None:
+            raise _credentials_exception()
+        
+        user = UserInDB.from_orm(db_user)
+        await cache_user(user)
     
     # Store user in request state for use in other dependencies
     request.state.user = user
-    return UserInDB.from_orm(user)
+    return user
 
 async def get_current_active_user(
     current_user: UserInDB = Depends(get_current_user),
@@ -100,3 +144,41 @@ async def get_current_admin_user(
             detail="The user doesn't have enough privileges",
         )
     return current_user
+
+@dataclass(frozen=True)
+class TokenPrincipal:
+    """Who a request is authenticated as, as far as authorization needs to know."""
+    id: int
+    role: UserRole
+    is_active: bool
+
+async def get_current_principal(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> TokenPrincipal:
+    """
+    Authorize from the token's role/active claims, without loading the user.
+
+    Changing a user's role or deactivating them revokes the tokens issued
+    before (see core.revocation), so claims that still verify are current.
+    Tokens issued without the claims fall back to loading the user.
+    """
+    claims = _decode_token(credentials)
+    user_id = int(claims["sub"])
+    if "role" in claims and "active" in claims:
+        return TokenPrincipal(id=user_id, role=UserRole(claims["role"]), is_active=claims["active"])
+    
+    user = await _load_user(request, user_id, db)
+    return TokenPrincipal(id=user.id, role=user.role, is_active=user.is_active)
+
+async def get_current_active_principal(
+    principal: TokenPrincipal = Depends(get_current_principal),
+) -> TokenPrincipal:
+    """Counterpart of get_current_active_user for read-only routes."""
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+    return principal
@@ -0,0 +1,24 @@
+from typing import Any, Mapping, Optional
+
+import orjson
+from fastapi import Response
+
+# UTC datetimes end in "Z", matching what Pydantic emits
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+def dumps(content: Any) -> bytes:
+    """Encode plain Python data (dicts, lists, datetimes, enums) to JSON bytes."""
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+def fast_json_response(
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """Build a JSON response without response_model validation or jsonable_encoder."""
+    return Response(
+        content=dumps(content),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers
+    )
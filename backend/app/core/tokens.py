@@ -0,0 +1,88 @@
+import time
+from typing import Any, Dict, Optional
+
+from jose import JWTError, jwt
+
+from .cache import TTLCache
+from .config import settings
+
+
+class TokenVerifier:
+    """
+    Signs and verifies JWTs with a set of keys identified by `kid`.
+
+    New tokens are signed with the active key; any configured key is
+    accepted for verification, so keys can rotate without logging users
+    out. Tokens without a `kid` (issued before rotation support) are
+    checked against `legacy_key`, if there is one.
+
+    Verified claims are cached per token until the token's `exp`, so a
+    client repeating the same bearer token skips the HMAC and JSON work.
+    """
+
+    def __init__(
+        self,
+        keys: Dict[str, str],
+        active_kid: str,
+        algorithm: str,
+        legacy_key: Optional[str] = None,
+        cache_size: int = 10000
+    ):
+        if active_kid not in keys:
+            raise ValueError(f"Active signing key {active_kid!r} is not configured")
+        self.keys = keys
+        self.active_kid = active_kid
+        self.algorithm = algorithm
+        self.legacy_key = legacy_key
+        self.cache = TTLCache(maxsize=cache_size, ttl=0)
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return jwt.encode(
+            claims,
+            self.keys[self.active_kid],
+            algorithm=self.algorithm,
+            headers={"kid": self.active_kid}
+        )
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """Return the token's verified claims or raise JWTError."""
+        claims = self.cache.get(token)
+        if claims is not None:
+            return claims
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self.keys.get(kid) if kid is not None else self.legacy_key
+        if key is None:
+            raise JWTError("Unknown signing key")
+
+        claims = jwt.decode(token, key, algorithms=[self.algorithm])
+
+        # Only tokens with an expiry are cached, and never past it
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            remaining = exp - time.time()
+            if remaining > 0:
+                self.cache.set(token, claims, ttl=remaining)
+        return claims
+
+    def forget(self, token: str) -> None:
+        self.cache.delete(token)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+
+def _build_verifier() -> TokenVerifier:
+    keys = dict(settings.JWT_SIGNING_KEYS) or {"default": settings.SECRET_KEY}
+    active_kid = settings.JWT_ACTIVE_KID or next(iter(keys))
+    return TokenVerifier(
+        keys=keys,
+        active_kid=active_kid,
+        algorithm=settings.ALGORITHM,
+        # Kid-less tokens were signed with SECRET_KEY; once keys are
+        # configured it is retired like any key left out of them
+        legacy_key=None if settings.JWT_SIGNING_KEYS else settings.SECRET_KEY,
+        cache_size=settings.TOKEN_CACHE_MAX_SIZE
+    )
+
+token_verifier = _build_verifier()
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from typing import Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from .cache import TTLCache, create_cache_backend
+from .config import settings
+from ..models.user import User
+from ..schemas.user import UserInDB
+
+logger = logging.getLogger(__name__)
+
+# Local tier: authenticated users keyed by id
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+# Optional shared tier so workers can reuse each other's lookups
+shared_backend = create_cache_backend(settings.USER_CACHE_BACKEND)
+
+_pending_tasks: Set[asyncio.Task] = set()
+
+def _shared_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+async def get_cached_user(user_id: int) -> Optional[UserInDB]:
+    """Return the cached user, checking the local tier before the shared one."""
+    user = user_cache.get(user_id)
+    if user is not None or shared_backend is None:
+        return user
+
+    payload = await shared_backend.get(_shared_key(user_id))
+    if payload is None:
+        return None
+    user = UserInDB.model_validate_json(payload)
+    user_cache.set(user_id, user)
+    return user
+
+async def cache_user(user: UserInDB) -> None:
+    """Store a user in both cache tiers."""
+    user_cache.set(user.id, user)
+    if shared_backend is not None:
+        await shared_backend.set(
+            _shared_key(user.id),
+            user.model_dump_json(),
+            ttl=settings.USER_CACHE_TTL_SECONDS
+        )
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a user from both cache tiers."""
+    user_cache.delete(user_id)
+    if shared_backend is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("No running event loop; shared cache entry for user %s left to expire", user_id)
+        return
+    task = loop.create_task(shared_backend.delete(_shared_key(user_id)))
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+def invalidate_user_on_commit(session: Session, user_id: int) -> None:
+    """Invalidate now and again when `session` commits; for writes the ORM events don't see."""
+    invalidate_user(user_id)
+    session.info.setdefault("invalidated_user_ids", set()).add(user_id)
+
+# Any write to a user (deactivation, role change, rename...) invalidates the
+# cached copy right away, and again once the transaction commits so that a
+# concurrent request cannot re-cache the pre-commit row.
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _on_user_changed(mapper, connection, target: User) -> None:
+    session = object_session(target)
+    if session is not None:
+        invalidate_user_on_commit(session, target.id)
+    else:
+        invalidate_user(target.id)
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    for user_id in session.info.pop("invalidated_user_ids", ()):
+        invalidate_user(user_id)
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session: Session) -> None:
+    session.info.pop("invalidated_user_ids", None)
@@ -0,0 +1,207 @@
+"""
+Batched, resumable, throttled backfills for large tables, and the other
+online schema-change helpers migrations use.
+
+A backfill walks its table in primary-key order, `batch_size` rows at a
+time, each batch in its own short transaction, sleeping `pause` seconds in
+between so regular traffic keeps its share of the database. The last id
+done is checkpointed in backfill_progress, so an interrupted run resumes
+where it stopped instead of rescanning the finished part. Migrations run
+backfills through backfill_online(), defining them in the revision itself
+so what a migration does stays fixed as the models change. They can also
+be run, or rerun, by name while the app is serving:
+
+    python -m app.db.backfills events_starts_at --batch-size 1000 --pause 0.05
+"""
+import argparse
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Dict, Sequence
+
+from sqlalchemy import (
+    Column, DateTime, Integer, MetaData, String, Table, bindparam, insert, select, text, update
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql.elements import ColumnElement
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_TABLE = "backfill_progress"
+
+# Runner bookkeeping, deliberately outside the models' metadata
+progress = Table(
+    PROGRESS_TABLE, MetaData(),
+    Column("name", String(100), primary_key=True),
+    Column("last_id", Integer, nullable=False, default=0),
+    Column("rows", Integer, nullable=False, default=0),
+    Column("finished_at", DateTime(timezone=True), nullable=True),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+)
+
+class Backfill(ABC):
+    """One backfill: which rows need work and what to set on them."""
+
+    name: str
+    table: Table
+    columns: Sequence[str]  # Read for compute(); the primary key `id` is always included
+
+    @abstractmethod
+    def pending(self) -> ColumnElement:
+        """Condition matching rows that still need the backfill."""
+
+    @abstractmethod
+    def compute(self, row) -> Dict[str, Any]:
+        """Column values to write for one row; they must take it out of pending()."""
+
+def run_backfill(
+    engine: Engine,
+    backfill: Backfill,
+    batch_size: int = 1000,
+    pause: float = 0.05,
+    restart: bool = False
+) -> int:
+    """
+    Run `backfill` to completion (or resume it); returns the rows updated by
+    this run.
+
+    A pass ends when no pending rows are left past the checkpoint. Rows
+    behind it can still turn up pending, written while the pass ran by
+    instances that don't set the columns yet, so another pass starts from
+    the beginning until none are left. A finished backfill run again makes
+    that check too, rather than trusting finished_at.
+    """
+    progress.create(engine, checkfirst=True)
+    table = backfill.table
+
+    with engine.begin() as conn:
+        state = conn.execute(select(progress).where(progress.c.name == backfill.name)).first()
+        if state is None:
+            conn.execute(insert(progress).values(name=backfill.name, updated_at=datetime.now(timezone.utc)))
+    resume = state is not None and state.finished_at is None and not restart
+    last_id = state.last_id if resume else 0
+    if last_id:
+        logger.info("Resuming backfill %s after id %d", backfill.name, last_id)
+
+    statement = update(table).where(table.c.id == bindparam("_id"))
+    done = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(table.c.id, *(table.c[name] for name in backfill.columns))
+                .where(table.c.id > last_id, backfill.pending())
+                .order_by(table.c.id)
+                .limit(batch_size)
+            ).all()
+            now = datetime.now(timezone.utc)
+            if not rows:
+                if last_id and conn.execute(select(table.c.id).where(backfill.pending()).limit(1)).first():
+                    logger.info("Backfill %s: pending rows behind id %d, starting another pass", backfill.name, last_id)
+                    last_id = 0
+                    continue
+                conn.execute(
+                    update(progress).where(progress.c.name == backfill.name)
+                    .values(finished_at=now, updated_at=now)
+                )
+                break
+
+            # Executemany UPDATE by primary key; the SET clause comes from the keys
+            conn.execute(statement, [{"_id": row.id, **backfill.compute(row)} for row in rows])
+            last_id = rows[-1].id
+            conn.execute(
+                update(progress).where(progress.c.name == backfill.name)
+                .values(last_id=last_id, rows=progress.c.rows + len(rows), finished_at=None, updated_at=now)
+            )
+
+        done += len(rows)
+        logger.info("Backfill %s: %d rows (%d this run), up to id %d", backfill.name, len(rows), done, last_id)
+        if pause:
+            time.sleep(pause)
+
+    logger.info("Backfill %s finished: %d rows updated", backfill.name, done)
+    return done
+
+def create_index_online(index_name: str, table_name: str, columns: Sequence[str], **kw) -> None:
+    """
+    Create an index from a migration without blocking writes: CONCURRENTLY on
+    Postgres, outside the migration's transaction. An invalid index left by
+    an interrupted concurrent build is dropped and rebuilt.
+    """
+    from alembic import context, op
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        if bind.dialect.name == "postgresql" and not context.is_offline_mode():
+            invalid = bind.scalar(text(
+                "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND NOT i.indisvalid"
+            ), {"name": index_name})
+            if invalid:
+                op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
+        op.create_index(
+            index_name, table_name, columns,
+            if_not_exists=True, postgresql_concurrently=True, **kw
+        )
+
+def drop_index_online(index_name: str, table_name: str) -> None:
+    """Drop an index from a migration without blocking writes: CONCURRENTLY on Postgres."""
+    from alembic import op
+
+    with op.get_context().autocommit_block():
+        op.drop_index(index_name, table_name=table_name, if_exists=True, postgresql_concurrently=True)
+
+def backfill_online(backfill: Backfill, batch_size: int = 1000, pause: float = 0.05) -> None:
+    """
+    Run a backfill from a migration, committing the migration's work so far
+    so the batches don't wait on its locks. `alembic -x backfill=skip` leaves
+    it for running by hand.
+    """
+    from alembic import context, op
+
+    if context.is_offline_mode() or context.get_x_argument(as_dictionary=True).get("backfill") == "skip":
+        logger.warning("Skipping backfill %s; run: python -m app.db.backfills %s", backfill.name, backfill.name)
+        return
+    with op.get_context().autocommit_block():
+        run_backfill(op.get_bind().engine, backfill, batch_size, pause)
+
+def migration_backfills() -> Dict[str, Backfill]:
+    """The backfills defined by revisions, as the module attribute `backfill`, by name."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    from .init_db import ALEMBIC_INI
+
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+    found = (getattr(revision.module, "backfill", None) for revision in script.walk_revisions())
+    return {backfill.name: backfill for backfill in found if backfill is not None}
+
+async def run_backfill_async(engine: AsyncEngine, backfill: Backfill, **kwargs) -> int:
+    async with engine.connect() as conn:
+        return await conn.run_sync(lambda sync_conn: run_backfill(sync_conn.engine, backfill, **kwargs))
+
+if __name__ == "__main__":
+    from .base import dispose_engine, engine
+
+    logging.basicConfig(level=logging.INFO)
+
+    backfills = migration_backfills()
+    parser = argparse.ArgumentParser(description="Run a batched backfill")
+    parser.add_argument("name", choices=sorted(backfills))
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--pause", type=float, default=0.05, help="Seconds to sleep between batches")
+    parser.add_argument("--restart", action="store_true", help="Start over instead of resuming")
+    args = parser.parse_args()
+
+    async def main() -> None:
+        try:
+            await run_backfill_async(
+                engine, backfills[args.name],
+                batch_size=args.batch_size, pause=args.pause, restart=args.restart
+            )
+        finally:
+            await dispose_engine()
+
+    asyncio.run(main())
@@ -1,41 +1,103 @@
-from sqlalchemy import create_engine
+import asyncio
+from contextlib import AsyncExitStack
+
+from fastapi import Request
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
 from ..core.config import settings
+from .base_class import Base
+from .pool import InstrumentedAsyncPool
+from .replicas import ReplicaSet, RoutingSession
+# Register every table on Base.metadata, the one metadata for create_all and Alembic
+from ..models import event, token_revocation, user  # noqa: F401
+
+def _async_url(url: str) -> str:
+    return url.replace("postgresql://", "postgresql+asyncpg://")
+
+# Database URL for asynchronous operations (the app and Alembic)
+ASYNC_DATABASE_URL = _async_url(settings.DATABASE_URI)
 
-# Database URL for synchronous operations (Alembic migrations, etc.)
-SYNC_DATABASE_URL = settings.DATABASE_URI
-# Database URL for asynchronous operations
-ASYNC_DATABASE_URL = SYNC_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+
+def _pool_options() -> Dict[str, Any]:
+    """Engine pool arguments derived from settings."""
+    if not settings.DB_POOL_ENABLED:
+        return {"poolclass": NullPool, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    return {
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
 
 # Create database engines
 engine = create_async_engine(
     ASYNC_DATABASE_URL,
     echo=False,
     future=True,
-    pool_pre_ping=True,
-    poolclass=NullPool  # Use NullPool for async operations
+    **_pool_options()
+)
+
+# Read-only replicas, each with its own pool
+replicas = ReplicaSet(
+    [
+        create_async_engine(_async_url(url), echo=False, future=True, **_pool_options())
+        for url in settings.DATABASE_REPLICA_URIS
+    ],
+    selection=settings.REPLICA_SELECTION,
+    sticky_seconds=settings.REPLICA_STICKY_SECONDS,
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS
 )
 
+class AppSession(RoutingSession):
+    replica_set = replicas
+
 # Session factory for async operations
 async_session_maker = sessionmaker(
     engine, 
     class_=AsyncSession, 
+    sync_session_class=AppSession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False
 )
 
-# Base class for all models
-Base = declarative_base()
+async def init_engine(warm_connections: int = 1) -> None:
+    """
+    Open `warm_connections` pooled connections at once, so startup fails fast
+    on a bad database and the first requests don't pay for connecting.
+    """
+    if not settings.DB_POOL_ENABLED:
+        warm_connections = 1
+    else:
+        warm_connections = max(1, min(warm_connections, settings.DB_POOL_SIZE))
+    
+    async with AsyncExitStack() as stack:
+        await asyncio.gather(*(
+            stack.enter_async_context(engine.connect()) for _ in range(warm_connections)
+        ))
+
+async def dispose_engine() -> None:
+    """Close all pooled connections, replicas included."""
+    await engine.dispose()
+    await replicas.dispose()
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Utilization and wait statistics for the async engine's pool."""
+    pool = engine.pool
+    if isinstance(pool, InstrumentedAsyncPool):
+        return pool.snapshot()
+    return {"status": pool.status()}
 
 # Dependency to get DB session
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency function that yields db sessions"""
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency function that yields db sessions; safe-method requests may read from replicas"""
     async with async_session_maker() as session:
+        session.info["read_only"] = request.method in ("GET", "HEAD")
         try:
             yield session
             await session.commit()
@@ -44,15 +106,3 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise e
         finally:
             await session.close()
-
-# For synchronous operations (Alembic, etc.)
-sync_engine = create_engine(SYNC_DATABASE_URL)
-SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
-
-def get_sync_db():
-    """Synchronous DB session for use with Alembic"""
-    db = SyncSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
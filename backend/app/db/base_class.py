@@ -1,15 +1,9 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel
-from sqlalchemy import Column, DateTime, Integer
+from sqlalchemy import DateTime, func
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
-from sqlalchemy.orm import Session
-
-# Define custom types for SQLAlchemy model, and Pydantic schemas
-ModelType = TypeVar("ModelType", bound="Base")
-CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
-UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+from sqlalchemy.orm import Mapped, mapped_column
 
 @as_declarative()
 class Base:
@@ -21,64 +15,10 @@ class Base:
     def __tablename__(cls) -> str:
         return cls.__name__.lower()
     
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    
-    def as_dict(self) -> Dict[str, Any]:
-        """Convert model instance to dictionary."""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
-    
-    @classmethod
-    def get(cls, db: Session, id: Any) -> Optional[ModelType]:
-        """Get a single record by ID."""
-        return db.query(cls).filter(cls.id == id).first()
-    
-    @classmethod
-    def get_multi(
-        cls, db: Session, *, skip: int = 0, limit: int = 100
-    ) -> List[ModelType]:
-        """Get multiple records with pagination."""
-        return db.query(cls).offset(skip).limit(limit).all()
-    
-    @classmethod
-    def create(cls, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
-        """Create a new record."""
-        obj_in_data = obj_in.dict()
-        db_obj = cls(**obj_in_data)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
-    
-    @classmethod
-    def update(
-        cls,
-        db: Session,
-        *,
-        db_obj: ModelType,
-        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
-    ) -> ModelType:
-        """Update a record."""
-        obj_data = db_obj.as_dict()
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.dict(exclude_unset=True)
-        
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
-        
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
-    
-    @classmethod
-    def remove(cls, db: Session, *, id: int) -> Optional[ModelType]:
-        """Remove a record."""
-        obj = db.query(cls).get(id)
-        if obj:
-            db.delete(obj)
-            db.commit()
-        return obj
+    # Set by the database, so INSERT/UPDATE ... RETURNING hands them back
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
@@ -0,0 +1,118 @@
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Sequence, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .bulk import format_error
+from .repository import EventRepository, events
+from ..models.event import Event, EventOccurrenceOverride, derive_start_columns
+from ..schemas.event import (
+    EventBatchItemResult,
+    EventBatchOperation,
+    EventBatchResult,
+    EventUpdate,
+    validate_time_format
+)
+
+logger = logging.getLogger(__name__)
+
+# Columns an update may not set to null
+REQUIRED_FIELDS = ("title", "date", "time")
+
+def validate_update(data: Dict[str, Any], current) -> Dict[str, Any]:
+    """Validate one update's fields and return the column values to set."""
+    values = EventUpdate.model_validate(data).model_dump(exclude_unset=True)
+    if not values:
+        raise ValueError("No fields to update")
+    for field in REQUIRED_FIELDS:
+        if field in values and values[field] is None:
+            raise ValueError(f"{field} cannot be null")
+    if "time" in values:
+        values["time"] = validate_time_format(values["time"])
+    if values.keys() & set(EventRepository.START_FIELDS):
+        # Bulk updates skip the model's flush hooks, so derive the start columns here
+        derive_start_columns(values, current)
+    return values
+
+async def apply_event_batch(
+    session: AsyncSession,
+    operations: Sequence[EventBatchOperation],
+    atomic: bool = True
+) -> EventBatchResult:
+    """
+    Validate a batch of updates and deletes, then apply them in one transaction.
+
+    Statements are set-based: one DELETE ... WHERE id IN for the deletes, one
+    UPDATE ... WHERE id IN per distinct set of new values, and one
+    executemany UPDATE by primary key per set of updated columns whose values
+    differ. With `atomic`, any invalid operation means none are applied;
+    otherwise the valid ones are applied and the rest reported.
+    """
+    result = EventBatchResult(results=[
+        EventBatchItemResult(index=index, id=operation.id, op=operation.op, ok=False)
+        for index, operation in enumerate(operations)
+    ])
+
+    ids = {operation.id for operation in operations}
+    existing = await events.get_many(
+        session, ids, Event.id, Event.date, Event.time, Event.recurrence_rule
+    )
+
+    seen = set()
+    deletes: List[int] = []
+    updates: Dict[int, Dict[str, Any]] = {}
+    for item, operation in zip(result.results, operations):
+        try:
+            if operation.id in seen:
+                raise ValueError("Event appears in more than one operation")
+            seen.add(operation.id)
+            if operation.id not in existing:
+                raise LookupError("Event not found")
+            if operation.op == "delete":
+                deletes.append(operation.id)
+            else:
+                updates[operation.id] = validate_update(operation.data or {}, existing[operation.id])
+            item.ok = True
+        except (ValidationError, ValueError, LookupError) as e:
+            item.error = format_error(e)
+            result.failed += 1
+
+    if atomic and result.failed:
+        for item in result.results:
+            if item.ok:
+                item.ok = False
+                item.error = "Not applied: another operation in the batch failed"
+        return result
+
+    # Overrides of deleted events, and of series whose occurrences moved
+    reset = deletes + [event_id for event_id, values in updates.items() if "recurrence_until" in values]
+    if reset:
+        await session.execute(
+            delete(EventOccurrenceOverride).where(EventOccurrenceOverride.event_id.in_(reset))
+        )
+    if deletes:
+        await session.execute(delete(Event).where(Event.id.in_(deletes)))
+
+    groups: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+    for event_id, values in updates.items():
+        groups[tuple(sorted(values))].append(event_id)
+    for event_ids in groups.values():
+        first = updates[event_ids[0]]
+        if all(updates[event_id] == first for event_id in event_ids):
+            await session.execute(update(Event).where(Event.id.in_(event_ids)).values(**first))
+        else:
+            await session.execute(
+                update(Event),
+                [{"id": event_id, **updates[event_id]} for event_id in event_ids]
+            )
+
+    await session.commit()
+    result.applied = len(deletes) + len(updates)
+    logger.debug(
+        "Applied event batch: %d updates in %d statements, %d deletes",
+        len(updates), len(groups), len(deletes)
+    )
+    return result
@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+import logging
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.event import Event, derive_start_columns
+from ..schemas.event import BulkImportResult, BulkRowError, EventCreate, validate_time_format
+
+logger = logging.getLogger(__name__)
+
+# Columns written by an import, in COPY order
+IMPORT_COLUMNS = (
+    "title", "description", "date", "time", "starts_at", "image_url",
+    "recurrence_rule", "recurrence_until", "created_by_id"
+)
+
+# A parsed record: (1-based row number, field dict or the reason it could not be parsed)
+ParsedRecord = Tuple[int, Union[Dict[str, Any], str]]
+
+def parse_ndjson(text: str) -> Iterator[ParsedRecord]:
+    """Yield one record per non-blank line of newline-delimited JSON."""
+    for row, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield row, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield row, "Each line must be a JSON object"
+            continue
+        yield row, record
+
+def parse_csv(text: str) -> Iterator[ParsedRecord]:
+    """Yield one record per CSV data row; the first row holds the column names."""
+    reader = csv.DictReader(io.StringIO(text))
+    for row, record in enumerate(reader, start=1):
+        if None in record:
+            yield row, "Row has more fields than the header"
+            continue
+        # Empty cells mean "not set" for the optional columns
+        yield row, {key: (value if value != "" else None) for key, value in record.items()}
+
+def validate_event_record(record: Dict[str, Any], created_by_id: int) -> Dict[str, Any]:
+    """Validate one record against EventCreate and return insertable column values."""
+    event_in = EventCreate.model_validate(record)
+    values = {
+        **event_in.model_dump(),
+        "time": validate_time_format(event_in.time),
+        "created_by_id": created_by_id
+    }
+    # Bulk inserts skip the model's flush hooks, so derive the start columns here
+    return derive_start_columns(values)
+
+def format_error(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+            for error in e.errors()
+        )
+    return str(e)
+
+async def _insert_chunk(session: AsyncSession, rows: List[Dict[str, Any]], use_copy: bool) -> None:
+    connection = await session.connection()
+    if use_copy and connection.dialect.driver == "asyncpg":
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            Event.__tablename__,
+            records=[tuple(row[column] for column in IMPORT_COLUMNS) for row in rows],
+            columns=list(IMPORT_COLUMNS)
+        )
+    else:
+        # Executemany; SQLAlchemy batches this into multi-row INSERT statements
+        await session.execute(insert(Event), rows)
+
+async def import_events(
+    session: AsyncSession,
+    records: Iterable[ParsedRecord],
+    created_by_id: int,
+    chunk_size: int = 1000,
+    use_copy: bool = True,
+    max_errors: int = 1000
+) -> BulkImportResult:
+    """
+    Validate and insert event records chunk by chunk.
+
+    Each chunk is committed on its own, so a failure part-way through keeps
+    the rows already imported. Invalid rows are skipped and reported; at most
+    `max_errors` of them are listed in the result.
+    """
+    result = BulkImportResult()
+    records = iter(records)
+
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+
+        rows = []
+        for row, record in chunk:
+            try:
+                if isinstance(record, str):
+                    raise ValueError(record)
+                rows.append(validate_event_record(record, created_by_id))
+            except (ValidationError, ValueError) as e:
+                result.failed += 1
+                if len(result.errors) < max_errors:
+                    result.errors.append(BulkRowError(row=row, error=format_error(e)))
+
+        if rows:
+            await _insert_chunk(session, rows, use_copy)
+            await session.commit()
+            result.inserted += len(rows)
+            logger.debug("Imported %d events (%d so far)", len(rows), result.inserted)
+
+    return result
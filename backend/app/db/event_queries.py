@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Select, or_
+
+from ..models.event import Event
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def apply_event_filters(
+    query: Select,
+    *,
+    search: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    starts_from: Optional[datetime] = None,
+    starts_to: Optional[datetime] = None,
+    time_from: Optional[str] = None,
+    time_to: Optional[str] = None
+) -> Select:
+    """
+    Narrow an events query by free text, date range, start moment and time of day.
+    
+    The substring match is served by the trigram indexes on Postgres, the
+    date bounds by the (date, id) B-tree and the start bounds by the
+    (starts_at, id) B-tree. Time-of-day bounds compare the zero-padded
+    HH:MM strings, so they are evaluated in SQL too.
+    """
+    if search:
+        pattern = f"%{escape_like(search.strip())}%"
+        query = query.filter(
+            or_(
+                Event.title.ilike(pattern, escape="\\"),
+                Event.description.ilike(pattern, escape="\\")
+            )
+        )
+    if start_date is not None:
+        query = query.filter(Event.date >= start_date)
+    if end_date is not None:
+        query = query.filter(Event.date <= end_date)
+    if starts_from is not None:
+        query = query.filter(Event.starts_at >= starts_from)
+    if starts_to is not None:
+        query = query.filter(Event.starts_at <= starts_to)
+    if time_from is not None:
+        query = query.filter(Event.time >= time_from)
+    if time_to is not None:
+        query = query.filter(Event.time <= time_to)
+    return query
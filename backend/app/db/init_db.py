@@ -1,54 +1,47 @@
 import asyncio
 import logging
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from pathlib import Path
 
-from .base import Base
-from ..core.config import settings
+from .base import Base, engine, dispose_engine
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create async engine
-ASYNC_DATABASE_URL = settings.DATABASE_URI.replace("postgresql://", "postgresql+asyncpg://")
-async_engine = create_async_engine(ASYNC_DATABASE_URL)
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
 
-# Create async session
-async_session_maker = sessionmaker(
-    async_engine, class_=AsyncSession, expire_on_commit=False
-)
-
-# Create sync engine for migrations
-SYNC_DATABASE_URL = settings.DATABASE_URI
-engine = create_engine(SYNC_DATABASE_URL)
+def upgrade_database(revision: str = "head") -> None:
+    """Apply migrations up to `revision` (what `alembic upgrade head` does)."""
+    from alembic import command
+    from alembic.config import Config
+    
+    command.upgrade(Config(str(ALEMBIC_INI)), revision)
 
 async def create_tables():
     """Create database tables."""
-    async with async_engine.begin() as conn:
+    async with engine.begin() as conn:
         logger.info("Creating database tables...")
         await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables created successfully.")
 
 async def drop_tables():
     """Drop all database tables."""
-    async with async_engine.begin() as conn:
+    async with engine.begin() as conn:
         logger.warning("Dropping all database tables...")
         await conn.run_sync(Base.metadata.drop_all)
         logger.warning("All database tables dropped.")
 
-def reset_database():
-    ""
+async def reset_database():
+    """
     Reset the database by dropping and recreating all tables.
     WARNING: This will delete all data in the database!
     """
     logger.warning("Resetting database...")
     
-    # Drop all tables
-    Base.metadata.drop_all(engine)
-    
-    # Create all tables
-    Base.metadata.create_all(engine)
+    try:
+        await drop_tables()
+        await create_tables()
+    finally:
+        await dispose_engine()
     
     logger.info("Database reset complete.")
 
@@ -56,6 +49,11 @@ if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description="Database management utility")
+    parser.add_argument(
+        "--upgrade",
+        action="store_true",
+        help="Apply pending migrations, including their online backfills"
+    )
     parser.add_argument(
         "--reset", 
         action="store_true", 
@@ -64,10 +62,12 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
-    if args.reset:
+    if args.upgrade:
+        upgrade_database()
+    elif args.reset:
         confirm = input("WARNING: This will delete all data in the database! Are you sure? (y/n): ")
         if confirm.lower() == 'y':
-            reset_database()
+            asyncio.run(reset_database())
         else:
             print("Database reset cancelled.")
     else:
@@ -0,0 +1,63 @@
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass
+class PoolStats:
+    """Counters collected by InstrumentedAsyncPool."""
+    checkouts: int = 0
+    overflow_hits: int = 0
+    timeouts: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    def record_wait(self, elapsed: float) -> None:
+        self.checkouts += 1
+        self.wait_time_total += elapsed
+        if elapsed > self.wait_time_max:
+            self.wait_time_max = elapsed
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long callers wait for a connection
+    and how often the pool has to dip into its overflow.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        # _overflow starts at -pool_size, so it only becomes positive once
+        # connections beyond pool_size have been opened.
+        overflow_before = self._overflow
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        self.stats.record_wait(time.perf_counter() - start)
+        if self._overflow > overflow_before and self._overflow > 0:
+            self.stats.overflow_hits += 1
+        return entry
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return current utilization and the collected counters."""
+        stats = asdict(self.stats)
+        stats["wait_time_avg"] = (
+            self.stats.wait_time_total / self.stats.checkouts if self.stats.checkouts else 0.0
+        )
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            **stats,
+        }
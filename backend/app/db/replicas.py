@@ -0,0 +1,180 @@
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Replica:
+    engine: AsyncEngine
+    name: str
+    healthy: bool = True
+    failures: int = 0
+    ejected_at: Optional[float] = None
+    last_error: Optional[str] = None
+
+    def checked_out(self) -> int:
+        checkedout = getattr(self.engine.pool, "checkedout", None)
+        return checkedout() if checkedout else 0
+
+    def eject(self, reason: str) -> None:
+        self.failures += 1
+        self.last_error = reason
+        if self.healthy:
+            self.healthy = False
+            self.ejected_at = time.time()
+            logger.warning("Ejecting read replica %s: %s", self.name, reason)
+
+    def readmit(self) -> None:
+        if not self.healthy:
+            logger.info("Read replica %s is healthy again", self.name)
+        self.healthy = True
+        self.ejected_at = None
+
+class ReplicaSet:
+    """
+    Read-only replica engines plus the policy for picking one.
+
+    Replicas that raise connection errors, fail a health check or (on
+    Postgres, when `max_lag` is set) fall too far behind are ejected;
+    the periodic health check readmits them once they answer again. With
+    no healthy replica every read goes to the primary.
+    """
+
+    def __init__(
+        self,
+        engines: List[AsyncEngine],
+        selection: str = "round_robin",
+        sticky_seconds: float = 0.0,
+        max_lag: float = 0.0
+    ):
+        if selection not in ("round_robin", "least_busy"):
+            raise ValueError(f"Unknown replica selection policy {selection!r}")
+        self.replicas = [
+            Replica(engine, make_url(engine.url).render_as_string(hide_password=True))
+            for engine in engines
+        ]
+        self.selection = selection
+        self.sticky_seconds = sticky_seconds
+        self.max_lag = max_lag
+        self.last_write_at = 0.0
+        self._counter = itertools.count()
+        self._by_sync_engine: Dict[Engine, Replica] = {}
+        for replica in self.replicas:
+            self._by_sync_engine[replica.engine.sync_engine] = replica
+            event.listen(replica.engine.sync_engine, "handle_error", self._on_error)
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def _on_error(self, context) -> None:
+        # Only connection-level failures say something about the replica
+        if context.is_disconnect or context.connection is None:
+            replica = self._by_sync_engine.get(context.engine)
+            if replica is not None:
+                replica.eject(str(context.original_exception))
+
+    def note_write(self) -> None:
+        self.last_write_at = time.monotonic()
+
+    def choose(self) -> Optional[Replica]:
+        """Pick a healthy replica, or None if reads should go to the primary."""
+        # Replication lag: just after this worker wrote, reads must see the write
+        if self.sticky_seconds and time.monotonic() - self.last_write_at < self.sticky_seconds:
+            return None
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        if self.selection == "least_busy":
+            return min(healthy, key=Replica.checked_out)
+        return healthy[next(self._counter) % len(healthy)]
+
+    async def _check(self, replica: Replica, timeout: float) -> None:
+        async def probe() -> Optional[float]:
+            async with replica.engine.connect() as conn:
+                if self.max_lag and conn.dialect.name == "postgresql":
+                    lag = await conn.scalar(text(
+                        "SELECT EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+                    ))
+                    return float(lag) if lag is not None else None
+                await conn.execute(text("SELECT 1"))
+                return None
+
+        try:
+            lag = await asyncio.wait_for(probe(), timeout=timeout)
+        except Exception as e:
+            replica.eject(f"health check failed: {e!r}")
+            return
+        if lag is not None and lag > self.max_lag:
+            replica.eject(f"replication lag {lag:.1f}s")
+        else:
+            replica.readmit()
+
+    async def check_health(self, timeout: float) -> None:
+        await asyncio.gather(*(self._check(replica, timeout) for replica in self.replicas))
+
+    async def check_health_periodically(self, interval: float, timeout: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.check_health(timeout)
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": replica.name,
+                "healthy": replica.healthy,
+                "failures": replica.failures,
+                "checked_out": replica.checked_out(),
+                "ejected_at": replica.ejected_at,
+                "last_error": replica.last_error,
+            }
+            for replica in self.replicas
+        ]
+
+class RoutingSession(Session):
+    """
+    Sends reads of read-only sessions to a replica and everything else to
+    the primary.
+
+    A session is read-only when `info["read_only"]` is set (get_db does this
+    for GET and HEAD requests). Once a session flushes or runs a write, all
+    of its later statements stay on the primary so it reads its own writes.
+    One replica is picked per session, keeping a request's reads consistent.
+    """
+
+    replica_set: Optional[ReplicaSet] = None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica_set = self.replica_set
+        if not replica_set:
+            return super().get_bind(mapper, clause=clause, **kw)
+
+        if self._flushing or (
+            clause is not None
+            and (getattr(clause, "is_dml", False) or getattr(clause, "_for_update_arg", None) is not None)
+        ):
+            self.info["read_only"] = False
+            replica_set.note_write()
+            return super().get_bind(mapper, clause=clause, **kw)
+
+        if not self.info.get("read_only"):
+            return super().get_bind(mapper, clause=clause, **kw)
+        if "replica" not in self.info:
+            self.info["replica"] = replica_set.choose()
+        replica = self.info["replica"]
+        if replica is None or not replica.healthy:
+            return super().get_bind(mapper, clause=clause, **kw)
+        return replica.engine.sync_engine
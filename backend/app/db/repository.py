@@ -0,0 +1,176 @@
+"""
+Async data access over the models' single metadata.
+
+A Repository wraps one model with the statements handlers need, one round
+trip each: lookups by id or column, batched lookups of many ids, multi-row
+inserts, and inserts, updates and deletes that hand back the written row
+with RETURNING instead of a follow-up SELECT or refresh. Reads and writes
+return model instances, or rows of just `columns` when those are given.
+
+Nothing here commits; the caller (normally get_db) owns the transaction.
+"""
+from typing import Any, Dict, Generic, Iterable, List, Mapping, Optional, Sequence, Type, TypeVar
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base_class import Base
+from ..core.revocation import CLAIMED_USER_FIELDS, revoke_user_on_commit
+from ..core.user_cache import invalidate_user_on_commit
+from ..models.event import Event, EventOccurrenceOverride, derive_start_columns
+from ..models.user import User
+
+ModelType = TypeVar("ModelType", bound=Base)
+
+class Repository(Generic[ModelType]):
+    def __init__(self, model: Type[ModelType]):
+        self.model = model
+
+    def _entities(self, columns: Sequence[Any]) -> Sequence[Any]:
+        return columns or (self.model,)
+
+    def _first(self, result: Result, columns: Sequence[Any]) -> Optional[Any]:
+        return result.first() if columns else result.scalars().first()
+
+    def _all(self, result: Result, columns: Sequence[Any]) -> List[Any]:
+        return list(result.all() if columns else result.scalars().all())
+
+    async def get(self, session: AsyncSession, id: Any, *columns: Any) -> Optional[Any]:
+        """The row with primary key `id`, or None."""
+        result = await session.execute(
+            select(*self._entities(columns)).where(self.model.id == id)
+        )
+        return self._first(result, columns)
+
+    async def get_by(self, session: AsyncSession, *columns: Any, **filters: Any) -> Optional[Any]:
+        """The first row whose columns equal `filters`, or None."""
+        result = await session.execute(
+            select(*self._entities(columns)).filter_by(**filters).limit(1)
+        )
+        return self._first(result, columns)
+
+    async def get_many(self, session: AsyncSession, ids: Iterable[Any], *columns: Any) -> Dict[Any, Any]:
+        """
+        Rows for `ids` in one IN query, keyed by id; missing ids are left out.
+        `columns`, when given, must include the primary key.
+        """
+        ids = set(ids)
+        if not ids:
+            return {}
+        result = await session.execute(
+            select(*self._entities(columns)).where(self.model.id.in_(ids))
+        )
+        return {row.id: row for row in self._all(result, columns)}
+
+    def prepare_insert(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Hook for columns the model derives on flush, since these statements
+        skip the ORM's flush events.
+        """
+        return values
+
+    async def prepare_update(
+        self,
+        session: AsyncSession,
+        id: Any,
+        values: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Like prepare_insert(), for an update; None when the row doesn't exist."""
+        return values
+
+    async def create(self, session: AsyncSession, values: Mapping[str, Any], *columns: Any) -> Any:
+        """Insert one row and return it, server defaults included."""
+        result = await session.execute(
+            insert(self.model)
+            .values(**self.prepare_insert(dict(values)))
+            .returning(*self._entities(columns))
+        )
+        return self._first(result, columns)
+
+    async def create_many(
+        self,
+        session: AsyncSession,
+        rows: Iterable[Mapping[str, Any]],
+        *columns: Any
+    ) -> List[Any]:
+        """
+        Insert many rows in batched multi-row INSERTs and return them in the
+        order given.
+        """
+        rows = [self.prepare_insert(dict(values)) for values in rows]
+        if not rows:
+            return []
+        result = await session.execute(
+            insert(self.model).returning(*self._entities(columns), sort_by_parameter_order=True),
+            rows
+        )
+        return self._all(result, columns)
+
+    async def update(
+        self,
+        session: AsyncSession,
+        id: Any,
+        values: Mapping[str, Any],
+        *columns: Any
+    ) -> Optional[Any]:
+        """Update the row with primary key `id` and return it, or None if there is none."""
+        values = await self.prepare_update(session, id, dict(values))
+        if values is None:
+            return None
+        result = await session.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(*self._entities(columns))
+        )
+        return self._first(result, columns)
+
+    async def delete(self, session: AsyncSession, id: Any) -> bool:
+        """Delete the row with primary key `id`; False if there was none."""
+        result = await session.execute(
+            delete(self.model).where(self.model.id == id).returning(self.model.id)
+        )
+        return result.scalar() is not None
+
+class EventRepository(Repository[Event]):
+    # Stored fields the derived start columns depend on
+    START_FIELDS = ("date", "time", "recurrence_rule")
+
+    def prepare_insert(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        return derive_start_columns(values)
+
+    async def prepare_update(
+        self,
+        session: AsyncSession,
+        id: Any,
+        values: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        if not values.keys() & set(self.START_FIELDS):
+            return values
+        current = None
+        if not all(name in values for name in self.START_FIELDS):
+            # A partial change to the start needs the stored fields, one extra read
+            current = await self.get(session, id, *(getattr(Event, name) for name in self.START_FIELDS))
+            if current is None:
+                return None
+        return derive_start_columns(values, current)
+
+class UserRepository(Repository[User]):
+    async def update(self, session: AsyncSession, id: Any, values: Mapping[str, Any], *columns: Any) -> Optional[Any]:
+        row = await super().update(session, id, values, *columns)
+        if row is not None:
+            invalidate_user_on_commit(session.sync_session, id)
+            if values.keys() & set(CLAIMED_USER_FIELDS):
+                revoke_user_on_commit(session.sync_session, id)
+        return row
+
+    async def delete(self, session: AsyncSession, id: Any) -> bool:
+        deleted = await super().delete(session, id)
+        if deleted:
+            invalidate_user_on_commit(session.sync_session, id)
+        return deleted
+
+events = EventRepository(Event)
+occurrence_overrides = Repository(EventOccurrenceOverride)
+users = UserRepository(User)
@@ -1,12 +1,16 @@
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import random
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.future import select
 
+from .core.config import settings
 from .db.base import async_session_maker
+from .db.bulk import import_events
+from .db.repository import events, users
 from .models.user import User, UserRole
 from .models.event import Event
-from .core.security import get_password_hash
+from .core.security import get_password_hash_async
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,67 +19,122 @@ async def create_initial_data():
     """Create initial data for development and testing."""
     async with async_session_maker() as session:
         # Check if we already have users
-        result = await session.execute(select(User))
-        if result.scalars().first() is not None:
+        if await users.get_by(session, User.id) is not None:
             logger.info("Database already has data, skipping initial data creation.")
             return
         
         logger.info("Creating initial data...")
         
-        # Create admin user
-        admin = User(
-            email="admin@example.com",
-            name="Admin User",
-            hashed_password=get_password_hash("admin123"),
-            role=UserRole.ADMIN,
-            is_active=True
+        # Hash the seed passwords concurrently on the hashing executor
+        admin_password, user_password = await asyncio.gather(
+            get_password_hash_async("admin123"),
+            get_password_hash_async("user123")
         )
         
-        # Create normal user
-        user = User(
-            email="user@example.com",
-            name="Normal User",
-            hashed_password=get_password_hash("user123"),
-            role=UserRole.NORMAL,
-            is_active=True
-        )
-        
-        session.add_all([admin, user])
-        await session.commit()
+        # Create the admin and a normal user in one INSERT ... RETURNING
+        admin, user = await users.create_many(session, [
+            {
+                "email": "admin@example.com",
+                "name": "Admin User",
+                "hashed_password": admin_password,
+                "role": UserRole.ADMIN,
+                "is_active": True
+            },
+            {
+                "email": "user@example.com",
+                "name": "Normal User",
+                "hashed_password": user_password,
+                "role": UserRole.NORMAL,
+                "is_active": True
+            }
+        ], User.id)
         
         # Create some sample events
         now = datetime.utcnow()
-        events = [
-            Event(
-                title="Team Building Workshop",
-                description="A fun team building activity for all employees.",
-                date=now + timedelta(days=7),
-                time="14:00",
-                created_by_id=admin.id,
-                image_url="https://example.com/team-building.jpg"
-            ),
-            Event(
-                title="Product Launch",
-                description="Launch of our new product line.",
-                date=now + timedelta(days=14),
-                time="10:00",
-                created_by_id=admin.id,
-                image_url="https://example.com/product-launch.jpg"
-            ),
-            Event(
-                title="Holiday Party",
-                description="Annual company holiday celebration.",
-                date=now + timedelta(days=30),
-                time="19:00",
-                created_by_id=user.id,
-                image_url="https://example.com/holiday-party.jpg"
-            )
-        ]
-        
-        session.add_all(events)
+        await events.create_many(session, [
+            {
+                "title": "Team Building Workshop",
+                "description": "A fun team building activity for all employees.",
+                "date": now + timedelta(days=7),
+                "time": "14:00",
+                "created_by_id": admin.id,
+                "image_url": "https://example.com/team-building.jpg"
+            },
+            {
+                "title": "Product Launch",
+                "description": "Launch of our new product line.",
+                "date": now + timedelta(days=14),
+                "time": "10:00",
+                "created_by_id": admin.id,
+                "image_url": "https://example.com/product-launch.jpg"
+            },
+            {
+                "title": "Holiday Party",
+                "description": "Annual company holiday celebration.",
+                "date": now + timedelta(days=30),
+                "time": "19:00",
+                "created_by_id": user.id,
+                "image_url": "https://example.com/holiday-party.jpg"
+            }
+        ], Event.id)
         await session.commit()
         
         logger.info("Initial data created successfully.")
 
+def synthetic_event_records(count: int, seed: int = 0):
+    """Yield `count` generated event records in the bulk import format."""
+    rng = random.Random(seed)
+    topics = ["Workshop", "Meetup", "Conference", "Webinar", "Hackathon", "Retreat", "Launch"]
+    teams = ["Engineering", "Design", "Sales", "Marketing", "Finance", "Support"]
+    start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    for row in range(1, count + 1):
+        topic, team = rng.choice(topics), rng.choice(teams)
+        hour, minute = rng.randrange(8, 20), rng.choice((0, 15, 30, 45))
+        yield row, {
+            "title": f"{team} {topic} #{row}",
+            "description": f"Synthetic {topic.lower()} for the {team.lower()} team.",
+            "date": start + timedelta(days=rng.randrange(-365, 365), hours=hour, minutes=minute),
+            "time": f"{hour:02d}:{minute:02d}",
+            "image_url": None,
+        }
+
+async def create_synthetic_events(count: int):
+    """Bulk insert `count` generated events owned by the first admin user."""
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(User.id).filter(User.role == UserRole.ADMIN).order_by(User.id).limit(1)
+        )
+        admin_id = result.scalar()
+        if admin_id is None:
+            logger.error("No admin user found; run without --synthetic first.")
+            return
+        
+        logger.info("Generating %d synthetic events...", count)
+        import_result = await import_events(
+            session,
+            synthetic_event_records(count),
+            created_by_id=admin_id,
+            chunk_size=settings.BULK_IMPORT_CHUNK_SIZE,
+            use_copy=settings.BULK_IMPORT_USE_COPY
+        )
+        logger.info("Inserted %d synthetic events.", import_result.inserted)
+
+async def main(synthetic: int = 0):
+    await create_initial_data()
+    if synthetic:
+        await create_synthetic_events(synthetic)
+
 if __name__ == "__main__":
-    asyncio.run(create_initial_data())
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Seed the database")
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Also bulk insert N generated events (for load testing)"
+    )
+    
+    args = parser.parse_args()
+    asyncio.run(main(args.synthetic))
@@ -1,15 +1,100 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from .core.config import settings
 from .api.api_v1.api import api_router
+from .api.endpoints import health
+from .core.change_feed import change_feed, create_transport
+from .core.hashing import password_hasher
+from .core.metrics import MetricsMiddleware, http_requests_total, http_request_duration_seconds
+from .core.query_stats import QueryStatsMiddleware, instrument_engine
+from .core.rate_limit import (
+    RateLimitMiddleware,
+    TokenBuckets,
+    create_rate_limit_backend,
+    parse_rate_limits,
+    rate_limited_requests_total
+)
+from .core.revocation import revocation_list
+from .db.base import async_session_maker, engine, init_engine, dispose_engine, replicas
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm up the database pool, hashing executor, revocation list and
+    replica health on startup and release them on shutdown. Servers only start accepting
+    connections once this startup phase has finished.
+    """
+    await init_engine(settings.DB_POOL_WARMUP)
+    await password_hasher.warmup()
+    
+    try:
+        async with async_session_maker() as session:
+            await revocation_list.sync(session)
+    except Exception:
+        logger.exception("Could not load token revocations")
+    revocation_task = asyncio.create_task(revocation_list.sync_periodically(
+        async_session_maker, settings.REVOCATION_SYNC_SECONDS
+    ))
+    
+    await change_feed.start(create_transport(settings.CHANGE_FEED_TRANSPORT))
+    
+    replica_task = None
+    if replicas:
+        await replicas.check_health(settings.READINESS_TIMEOUT_SECONDS)
+        replica_task = asyncio.create_task(replicas.check_health_periodically(
+            settings.REPLICA_HEALTH_CHECK_SECONDS, settings.READINESS_TIMEOUT_SECONDS
+        ))
+    
+    metrics_task = None
+    if settings.METRICS_MULTIPROC_DIR:
+        os.makedirs(settings.METRICS_MULTIPROC_DIR, exist_ok=True)
+        metrics_task = asyncio.create_task(health.flush_metrics_periodically())
+    
+    try:
+        yield
+    finally:
+        for task in (revocation_task, replica_task):
+            if task is not None:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+        if metrics_task is not None:
+            metrics_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await metrics_task
+            health.flush_metrics()
+        await change_feed.stop()
+        password_hasher.shutdown()
+        await dispose_engine()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="1.0.0",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
 )
 
+# Throttle login and signup before any hashing or queries; added first so
+# CORS headers and the metrics still apply to its 429s
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules=parse_rate_limits(settings.RATE_LIMITS),
+        buckets=TokenBuckets(settings.RATE_LIMIT_MAX_KEYS),
+        backend=create_rate_limit_backend(settings.RATE_LIMIT_BACKEND),
+        rejected=rate_limited_requests_total,
+    )
+
 # Set all CORS enabled origins
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
@@ -18,6 +103,7 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "ETag", "Last-Modified", "Retry-After"],
     )
 
 # Trusted Hosts Middleware
@@ -26,8 +112,27 @@ app.add_middleware(
     allowed_hosts=settings.ALLOWED_HOSTS,
 )
 
+# Per-request SQL counting and timing
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    instrument_engine(engine)
+    for replica in replicas.replicas:
+        instrument_engine(replica.engine)
+    app.add_middleware(
+        QueryStatsMiddleware,
+        repeat_threshold=settings.SQL_REPEAT_THRESHOLD,
+    )
+
+# Per-route latency histograms and status counters
+if settings.METRICS_ENABLED:
+    app.add_middleware(
+        MetricsMiddleware,
+        requests=http_requests_total,
+        latency=http_request_duration_seconds,
+    )
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
+app.include_router(health.router, tags=["health"])
 
 @app.get("/")
 async def root():
@@ -1,48 +1,127 @@
-from datetime import datetime, time
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func
+from sqlalchemy import Boolean, Integer, String, DateTime, ForeignKey, Index, DDL, UniqueConstraint, event
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
+from ..core.recurrence import as_utc, recurrence_until
 from ..db.base_class import Base
 
+def compose_starts_at(date: datetime, time: str) -> datetime:
+    """
+    The start moment: `date`'s UTC calendar day at `time` UTC (naive dates
+    are taken as UTC).
+
+    The database keeps `date` as an instant, not its offset, so combining in
+    UTC gives the same answer on every write, including those that read the
+    stored `date` back.
+    """
+    hours, minutes = map(int, time.split(":"))
+    date = as_utc(date)
+    return date.replace(hour=hours, minute=minutes, second=0, microsecond=0)
+
+def derive_start_columns(values: Dict[str, Any], current: Any = None) -> Dict[str, Any]:
+    """
+    Add starts_at, the zero-padded time, recurrence_until and the date in
+    UTC to the column `values` of an insert or update; fields they leave out are read from
+    `current`. Writes that skip the ORM flush call this themselves.
+    """
+    def field(name: str) -> Any:
+        return values[name] if name in values else getattr(current, name, None)
+    
+    # Stored in UTC so SQLite, which drops offsets, keeps the same instant
+    values["date"] = as_utc(field("date"))
+    starts_at = compose_starts_at(values["date"], field("time"))
+    values["starts_at"] = starts_at
+    values["time"] = starts_at.strftime("%H:%M")
+    values["recurrence_until"] = recurrence_until(field("recurrence_rule"), starts_at)
+    return values
+
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Matches the (date, id) ordering used for keyset pagination and
+        # serves date-range filters through its leading column
+        Index("ix_events_date_id", "date", "id"),
+        # Range scans on the start moment, e.g. "starting this week"
+        Index("ix_events_starts_at_id", "starts_at", "id"),
+        # Finds the series overlapping a window: started before its end
+        # and ending (recurrence_until, NULL = never) after its start
+        Index("ix_events_recurring_starts_at", "starts_at", "recurrence_until"),
+        # Trigram indexes for substring search (Postgres only, needs pg_trgm)
+        Index(
+            "ix_events_title_trgm", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_events_description_trgm", "description",
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    time: Mapped[str] = mapped_column(String, nullable=False)  # Storing time as string in HH:MM format
+    time: Mapped[str] = mapped_column(String, nullable=False)  # HH:MM, kept in step with starts_at for the API
+    # `date` and `time` combined; NULL only for rows written before it existed (see db.backfills)
+    starts_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     image_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    # RRULE-style rule (see core.recurrence); `date` is the first occurrence
+    recurrence_rule: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    # Start of the last occurrence, derived from the rule; NULL while the series is open-ended
+    recurrence_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     created_by_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
     
     # Relationships
     created_by: Mapped["User"] = relationship("User", back_populates="events")
+    overrides: Mapped[List["EventOccurrenceOverride"]] = relationship(
+        "EventOccurrenceOverride", back_populates="event",
+        cascade="all, delete-orphan", passive_deletes=True
+    )
     
     def __repr__(self) -> str:
         return f"<Event {self.title}>"
-    
-    @classmethod
-    def create_event(cls, db, event_in, user_id: int):
-        """Create a new event."""
-        event_data = event_in.dict()
-        db_event = cls(**event_data, created_by_id=user_id)
-        db.add(db_event)
-        db.commit()
-        db.refresh(db_event)
-        return db_event
-    
-    def update_event(self, db, event_in):
-        """Update an existing event."""
-        update_data = event_in.dict(exclude_unset=True)
-        
-        for field, value in update_data.items():
-            setattr(self, field, value)
-            
-        db.add(self)
-        db.commit()
-        db.refresh(self)
-        return self
+
+class EventOccurrenceOverride(Base):
+    """
+    An exception to one occurrence of a recurring event: either cancelled,
+    or with some fields replaced (a new `date` moves it).
+
+    `occurrence_start` is the start the rule generates for it and identifies
+    the occurrence even after it has been moved.
+    """
+    __tablename__ = "event_occurrence_overrides"
+    __table_args__ = (
+        UniqueConstraint("event_id", "occurrence_start", name="uq_event_occurrence_overrides_start"),
+        # Moved occurrences are found by their new date
+        Index("ix_event_occurrence_overrides_event_date", "event_id", "date"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    occurrence_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    cancelled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    title: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    time: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    image_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    event: Mapped["Event"] = relationship("Event", back_populates="overrides")
+
+    def __repr__(self) -> str:
+        return f"<EventOccurrenceOverride {self.event_id}@{self.occurrence_start}>"
+
+@event.listens_for(Event, "before_insert")
+def _derive_start_columns(mapper, connection, target: Event) -> None:
+    # Updates, bulk and RETURNING writes bypass this and call derive_start_columns()
+    for name, value in derive_start_columns({}, target).items():
+        setattr(target, name, value)
+
+# The trigram indexes need the pg_trgm extension before the table is created
+event.listen(
+    Event.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Integer, String, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.base_class import Base
+
+class TokenRevocation(Base):
+    """
+    A revoked access token (by `jti`) or, when `jti` is empty, every token
+    issued to `user_id` up to `revoked_at`.
+
+    Rows are only needed until `expires_at`, after which the tokens they
+    cover would be rejected as expired anyway.
+    """
+    __tablename__ = "token_revocations"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    jti: Mapped[Optional[str]] = mapped_column(String(64), unique=True, nullable=True)
+    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id"), nullable=True)
+    revoked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<TokenRevocation {self.jti or f'user={self.user_id}'}>"
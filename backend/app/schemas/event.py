@@ -1,13 +1,34 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict, List, Literal, Optional
 from datetime import datetime, time
 
+from ..core.recurrence import RecurrenceRule
+
+def validate_time_format(value: str) -> str:
+    """Check that a time string is a valid HH:MM value and return it zero-padded."""
+    time_parts = value.split(":")
+    if len(time_parts) != 2 or not all(part.isdigit() for part in time_parts):
+        raise ValueError("Time must be in HH:MM format")
+    hours, minutes = map(int, time_parts)
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError("Invalid time")
+    return f"{hours:02d}:{minutes:02d}"
+
+def validate_recurrence_rule(value: Optional[str]) -> Optional[str]:
+    """Check a recurrence rule and return it in canonical form."""
+    if value is None or not value.strip():
+        return None
+    return str(RecurrenceRule.parse(value))
+
 class EventBase(BaseModel):
     title: str = Field(..., min_length=3, max_length=100)
     description: Optional[str] = Field(None, max_length=1000)
     date: datetime
     time: str  # Format: "HH:MM"
     image_url: Optional[str] = None
+    recurrence_rule: Optional[str] = None  # e.g. "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10"
+
+    _check_recurrence_rule = field_validator("recurrence_rule")(validate_recurrence_rule)
 
 class EventCreate(EventBase):
     pass
@@ -18,9 +39,18 @@ class EventUpdate(BaseModel):
     date: Optional[datetime] = None
     time: Optional[str] = None  # Format: "HH:MM"
     image_url: Optional[str] = None
+    recurrence_rule: Optional[str] = None  # null or "" makes the event one-off again
+
+    _check_recurrence_rule = field_validator("recurrence_rule")(validate_recurrence_rule)
+
+class EventCreator(BaseModel):
+    """The part of the creating user an event response exposes."""
+    id: int
+    name: str
 
 class EventInDBBase(EventBase):
     id: int
+    starts_at: Optional[datetime] = None  # `date` combined with `time`; null until backfilled
     created_at: datetime
     updated_at: datetime
     created_by_id: int
@@ -29,7 +59,60 @@ class EventInDBBase(EventBase):
         from_attributes = True
 
 class Event(EventInDBBase):
-    pass
+    created_by: Optional[EventCreator] = None
 
 class EventInDB(EventInDBBase):
     pass
+
+class EventOccurrenceOverride(BaseModel):
+    """Changes to one occurrence of a recurring event; unset fields keep the series' values."""
+    cancelled: bool = False
+    title: Optional[str] = Field(None, min_length=3, max_length=100)
+    description: Optional[str] = Field(None, max_length=1000)
+    date: Optional[datetime] = None  # Moves the occurrence
+    time: Optional[str] = None  # Format: "HH:MM"
+    image_url: Optional[str] = None
+
+class EventOccurrence(BaseModel):
+    """One occurrence in a window; one-off events appear as their single occurrence."""
+    event_id: int
+    occurrence_start: datetime  # Identifies the occurrence, even if it was moved
+    date: datetime
+    time: str
+    title: str
+    description: Optional[str] = None
+    image_url: Optional[str] = None
+    recurrence_rule: Optional[str] = None
+    overridden: bool = False
+    created_by: Optional[EventCreator] = None
+
+class BulkRowError(BaseModel):
+    row: int  # 1-based line/record number in the upload
+    error: str
+
+class BulkImportResult(BaseModel):
+    inserted: int = 0
+    failed: int = 0
+    errors: List[BulkRowError] = []
+
+class EventBatchOperation(BaseModel):
+    op: Literal["update", "delete"]
+    id: int
+    data: Optional[Dict[str, Any]] = None  # EventUpdate fields, for updates
+
+class EventBatch(BaseModel):
+    operations: List[EventBatchOperation] = Field(..., min_length=1)
+    atomic: bool = True  # False applies the valid operations even if others fail
+
+class EventBatchItemResult(BaseModel):
+    index: int  # Position in `operations`
+    id: int
+    op: str
+    ok: bool
+    error: Optional[str] = None
+    event: Optional[Event] = None  # The updated event
+
+class EventBatchResult(BaseModel):
+    applied: int = 0
+    failed: int = 0
+    results: List[EventBatchItemResult] = []
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from typing import Optional
 
 class Token(BaseModel):
@@ -7,3 +7,14 @@ class Token(BaseModel):
 
 class TokenPayload(BaseModel):
     sub: Optional[int] = None
+
+class TokenRevoke(BaseModel):
+    """Revoke one token by its `jti`, or every current token of `user_id`."""
+    jti: Optional[str] = None
+    user_id: Optional[int] = None
+
+    @model_validator(mode="after")
+    def check_target(self) -> "TokenRevoke":
+        if (self.jti is None) == (self.user_id is None):
+            raise ValueError("Provide exactly one of jti or user_id")
+        return self
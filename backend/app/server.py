@@ -0,0 +1,63 @@
+"""
+Production server: gunicorn managing uvicorn workers.
+
+The app is imported once in the master (SERVER_PRELOAD) and workers are
+forked from it, so they skip the import and start quickly. Each worker
+then runs the app's lifespan, which warms up its own pool and executors
+before the worker accepts connections. On SIGTERM workers stop accepting,
+let in-flight requests finish for up to GRACEFUL_TIMEOUT seconds, then run
+the lifespan shutdown, which disposes the database pool.
+"""
+import os
+from importlib import import_module
+from typing import Any, Dict
+
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+
+from .core.config import settings
+
+def worker_count() -> int:
+    """WEB_CONCURRENCY, or one worker per CPU this process may run on."""
+    if settings.WEB_CONCURRENCY > 0:
+        return settings.WEB_CONCURRENCY
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+class ProductionWorker(UvicornWorker):
+    CONFIG_KWARGS = {
+        "loop": settings.SERVER_LOOP,
+        "http": settings.SERVER_HTTP,
+        "timeout_graceful_shutdown": settings.GRACEFUL_TIMEOUT,
+    }
+
+class ProductionServer(BaseApplication):
+    def __init__(self, app_uri: str, options: Dict[str, Any]):
+        self.app_uri = app_uri
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        module_name, attr = self.app_uri.split(":")
+        return getattr(import_module(module_name), attr)
+
+def server_options(workers: int) -> Dict[str, Any]:
+    return {
+        "bind": f"{settings.HOST}:{settings.PORT}",
+        "workers": workers,
+        "worker_class": "app.server.ProductionWorker",
+        "preload_app": settings.SERVER_PRELOAD,
+        "keepalive": settings.KEEPALIVE_TIMEOUT,
+        # Leave room for the lifespan shutdown after requests have drained
+        "graceful_timeout": settings.GRACEFUL_TIMEOUT + 5,
+        "accesslog": "-",
+    }
+
+def run_production(workers: int = 0) -> None:
+    ProductionServer("app.main:app", server_options(workers or worker_count())).run()
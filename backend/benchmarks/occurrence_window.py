@@ -0,0 +1,68 @@
+"""
+Show that expanding a recurring event costs in proportion to the window,
+not to how long the series has been running.
+
+    python -m benchmarks.occurrence_window --window-days 31 --iterations 2000
+
+For each rule and series age, "walk" generates occurrences from the first
+one and filters them to the window, as a naive expander would; "seek" is
+core.recurrence.occurrences(), which jumps straight to the window's first
+period. No database is needed.
+"""
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+from app.core.recurrence import RecurrenceRule, occurrences
+
+RULES = ("FREQ=DAILY", "FREQ=WEEKLY;BYDAY=MO,WE,FR", "FREQ=MONTHLY;BYMONTHDAY=1,15")
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--window-days", type=int, default=31)
+    parser.add_argument("--ages", default="1,10,50", help="Comma-separated series ages in years")
+    parser.add_argument("--iterations", type=int, default=2000)
+    return parser.parse_args()
+
+def timeit(fn: Callable[[], List[datetime]], iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+def main() -> None:
+    args = parse_args()
+    window_start = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    window_end = window_start + timedelta(days=args.window_days)
+
+    print(f"{args.window_days}-day window, median of {args.iterations} expansions")
+    print(f"{'rule':>30} {'age':>4} {'in window':>9} {'walk us':>9} {'seek us':>9} {'speedup':>8}")
+    for text in RULES:
+        rule = RecurrenceRule.parse(text)
+        for age in (int(years) for years in args.ages.split(",")):
+            dtstart = window_start.replace(year=window_start.year - age, hour=9)
+
+            def walk() -> List[datetime]:
+                found = []
+                for occurrence in occurrences(rule, dtstart, dtstart, window_end):
+                    if occurrence >= window_start:
+                        found.append(occurrence)
+                return found
+
+            def seek() -> List[datetime]:
+                return list(occurrences(rule, dtstart, window_start, window_end))
+
+            assert walk() == seek()
+            walk_us = timeit(walk, max(1, args.iterations // 10))
+            seek_us = timeit(seek, args.iterations)
+            print(
+                f"{text:>30} {age:>4} {len(seek()):>9} {walk_us:>9.1f} {seek_us:>9.1f} "
+                f"{walk_us / seek_us:>7.0f}x"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,28 @@
+import argparse
+
 import uvicorn
 from app.core.config import settings
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host=settings.HOST,
-        port=settings.PORT,
-        reload=True,
-        workers=1
+    parser = argparse.ArgumentParser(description="Run the API server")
+    parser.add_argument(
+        "--production",
+        action="store_true",
+        default=settings.SERVER_MODE == "production",
+        help="Run several preloaded workers under gunicorn (default from SERVER_MODE)"
     )
+    parser.add_argument("--workers", type=int, default=0, help="Override WEB_CONCURRENCY")
+    args = parser.parse_args()
+
+    if args.production:
+        from app.server import run_production
+
+        run_production(args.workers)
+    else:
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            reload=True,
+            workers=1
+        )
@@ -0,0 +1,26 @@
+import os
+import tempfile
+
+# Point the app at a throwaway SQLite database before anything imports settings
+os.environ["DATABASE_URI"] = "sqlite+aiosqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db")
+
+import httpx
+import pytest
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture(scope="module")
+async def client():
+    """A client for the app, running its lifespan over freshly created tables."""
+    from app.db.base import Base, engine
+    from app.main import app
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+            yield client
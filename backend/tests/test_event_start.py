@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.recurrence import RecurrenceRule, occurrences
+from app.models.event import derive_start_columns
+
+PLUS_TWO = timezone(timedelta(hours=2))
+UTC = timezone.utc
+
+def stored(values, dialect):
+    """The row as the database hands it back: Postgres in UTC, SQLite naive."""
+    def load(value):
+        if not isinstance(value, datetime):
+            return value
+        value = value.astimezone(UTC)
+        return value.replace(tzinfo=None) if dialect == "sqlite" else value
+    return SimpleNamespace(**{name: load(value) for name, value in values.items()})
+
+@pytest.mark.parametrize("dialect", ["postgresql", "sqlite"])
+def test_offset_date_round_trips_through_time_update(dialect):
+    created = derive_start_columns({
+        "date": datetime(2026, 6, 1, 0, 0, tzinfo=PLUS_TWO),
+        "time": "09:00",
+        "recurrence_rule": None,
+    })
+    row = stored(created, dialect)
+
+    # Recomputing from the stored row gives what the create computed
+    assert derive_start_columns({}, row)["starts_at"] == created["starts_at"]
+
+    updated = derive_start_columns({"time": "10:00"}, row)
+    assert updated["starts_at"] == created["starts_at"].replace(hour=10)
+    assert updated["starts_at"].date() == created["starts_at"].date()
+
+@pytest.mark.parametrize("dialect", ["postgresql", "sqlite"])
+def test_offset_date_keeps_every_occurrence(dialect):
+    created = derive_start_columns({
+        "date": datetime(2026, 6, 1, 0, 0, tzinfo=PLUS_TWO),
+        "time": "09:00",
+        "recurrence_rule": "FREQ=WEEKLY;COUNT=3",
+    })
+    row = stored(created, dialect)
+
+    rule = RecurrenceRule.parse(row.recurrence_rule)
+    found = list(occurrences(
+        rule, row.starts_at, datetime(2026, 5, 1, tzinfo=UTC), datetime(2026, 7, 1, tzinfo=UTC),
+        row.recurrence_until
+    ))
+    assert len(found) == 3
@@ -0,0 +1,104 @@
+import logging
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.http_cache import event_detail_cache, events_response_cache
+from app.core.query_stats import QueryBudgetExceeded, QueryStatsMiddleware, query_budget
+from app.core.user_cache import user_cache
+from app.db.base import async_session_maker
+from app.models.event import Event
+
+pytestmark = pytest.mark.anyio
+
+USERS = 4
+EVENTS_PER_USER = 3
+
+async def login(client, email):
+    r = await client.post("/api/v1/auth/login", data={"username": email, "password": "secret1"})
+    assert r.status_code == 200
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+@pytest.fixture(scope="module")
+async def auth(client):
+    """Events from several creators (creating needs an admin), so a per-row creator lookup would show."""
+    for i in range(USERS):
+        r = await client.post("/api/v1/auth/signup", json={
+            "email": f"user{i}@example.com", "name": f"User {i}", "password": "secret1", "role": "admin",
+        })
+        assert r.status_code == 201
+        headers = await login(client, f"user{i}@example.com")
+        for j in range(EVENTS_PER_USER):
+            r = await client.post("/api/v1/events/", headers=headers, json={
+                "title": f"Event {i}.{j}", "description": "budget", "time": "10:00",
+                "date": f"2026-0{j + 1}-1{i}T00:00:00Z",
+                "recurrence_rule": "FREQ=WEEKLY;COUNT=4" if j == 0 else None,
+            })
+            assert r.status_code == 201
+    return await login(client, "user0@example.com")
+
+@pytest.fixture(autouse=True)
+def cold_caches():
+    """Budgets are for the uncached path; caches would only hide queries."""
+    events_response_cache.invalidate()
+    user_cache.clear()
+
+async def fetch_within_budget(client, budget, method, path, **kwargs):
+    with query_budget(budget) as stats:
+        r = await client.request(method, path, **kwargs)
+    assert r.status_code == 200, r.text
+    assert stats.repeated(settings.SQL_REPEAT_THRESHOLD) == {}
+    return r
+
+@pytest.mark.parametrize("path, budget", [
+    ("/api/v1/events/?limit=100", 1),
+    ("/api/v1/events/?q=budget&start=2026-01-01T00:00:00Z", 1),
+    ("/api/v1/events/occurrences?start=2026-01-01T00:00:00Z&end=2026-12-31T00:00:00Z", 2),
+])
+async def test_event_reads_within_budget(client, auth, path, budget):
+    r = await fetch_within_budget(client, budget, "GET", path, headers=auth)
+    assert len(r.json()) >= USERS * EVENTS_PER_USER
+
+async def test_event_detail_within_budget(client, auth):
+    async with async_session_maker() as session:
+        event_id = await session.scalar(select(Event.id).limit(1))
+    event_detail_cache.invalidate(event_id)
+    r = await fetch_within_budget(client, 1, "GET", f"/api/v1/events/{event_id}", headers=auth)
+    assert r.json()["created_by"] is not None
+
+async def test_login_within_budget(client, auth):
+    await fetch_within_budget(
+        client, 1, "POST", "/api/v1/auth/login",
+        data={"username": "user1@example.com", "password": "secret1"}
+    )
+
+async def test_current_user_within_budget(client, auth):
+    await fetch_within_budget(client, 1, "GET", "/api/v1/auth/me", headers=auth)
+
+async def test_query_budget_fails_when_exceeded():
+    with pytest.raises(QueryBudgetExceeded, match="at most 1 queries, got 2"):
+        with query_budget(1):
+            async with async_session_maker() as session:
+                await session.scalar(select(Event.id).limit(1))
+                await session.scalar(select(Event.id).limit(1))
+
+async def test_repeated_statements_are_logged(caplog):
+    async def app(scope, receive, send):
+        async with async_session_maker() as session:
+            for _ in range(3):
+                await session.scalar(select(Event.id).limit(1))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    middleware = QueryStatsMiddleware(app, repeat_threshold=3)
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        await middleware({"type": "http", "method": "GET", "path": "/n-plus-one"}, receive, send)
+    assert '"repeated_statements"' in caplog.text
+    assert '"queries": 3' in caplog.text
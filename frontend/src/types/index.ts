@@ -31,15 +31,17 @@ export interface User {
     description: string;
     date: string; // ISO date string
     time: string; // HH:MM format
+    starts_at?: string | null; // ISO datetime combining date and time
     location: string;
     capacity: number;
     registration_deadline: string; // ISO date string
     additional_info?: string;
     image_url: string | null;
+    recurrence_rule?: string | null; // RRULE-style, e.g. "FREQ=WEEKLY;BYDAY=MO"
     created_by_id: number;
     created_at: string;
     updated_at: string;
-    created_by?: User; // Nested user data
+    created_by?: { id: number; name: string } | null; // Creator summary
     imageUrl?: string | null;
     user?: User; // To match what EventDetailPage expects
     price: number;